@@ -0,0 +1,68 @@
+"""In-memory response caching for hot GET endpoints."""
+
+import time
+from typing import Dict, List, Tuple
+
+# (expires_at, status, headers, body)
+_CacheEntry = Tuple[float, int, List[Tuple[bytes, bytes]], bytes]
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware serving repeated GET responses from memory.
+
+    Successful responses for the configured paths are cached per path for the
+    path's TTL in seconds and replayed without entering the handler. The
+    configured endpoints take no parameters, so the query string is ignored;
+    keying on it would let arbitrary query strings grow the cache without
+    bound. Cached responses carry a matching ``Cache-Control: max-age`` so
+    intermediate caches can help as well.
+    """
+
+    def __init__(self, app, ttls: Dict[str, float]):
+        self.app = app
+        self.ttls = ttls
+        # At most one entry per configured path
+        self._cache: Dict[str, _CacheEntry] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self.ttls:
+            await self.app(scope, receive, send)
+            return
+
+        ttl = self.ttls[scope["path"]]
+        key = scope["path"]
+
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            _, status, headers, body = entry
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        response: Dict[str, object] = {}
+        chunks: List[bytes] = []
+
+        async def send_and_capture(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                if message["status"] == 200:
+                    headers = [
+                        (name, value) for name, value in message.get("headers", [])
+                        if name.lower() != b"cache-control"
+                    ]
+                    headers.append((b"cache-control", f"max-age={int(ttl)}".encode()))
+                    message = {**message, "headers": headers}
+                response["headers"] = list(message.get("headers", []))
+            elif message["type"] == "http.response.body" and response.get("status") == 200:
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    self._cache[key] = (
+                        time.monotonic() + ttl,
+                        200,
+                        response["headers"],
+                        b"".join(chunks)
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_and_capture)
@@ -2,12 +2,16 @@
 
 import os
 import sys
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 import structlog
 from dotenv import load_dotenv
@@ -21,7 +25,12 @@ if env_path.exists():
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.orchestrator import Orchestrator
+from src.orchestrator.orchestrator import execute_task_sync
 from src.voice.voice_orchestrator import VoiceOrchestrator
+from src.api.tasks import celery_app, run_plan
+from src.api.cache import ResponseCacheMiddleware
+from src.orchestrator.log import orjson_dumps
+
 
 # Configure logging
 structlog.configure(
@@ -30,7 +39,8 @@ structlog.configure(
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer()
+        structlog.processors.format_exc_info,
+        structlog.processors.JSONRenderer(serializer=orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -39,18 +49,95 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
-# Initialize FastAPI
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the orchestrators inside the running loop and manage services."""
+    app.state.orchestrator = Orchestrator()
+    app.state.voice_orchestrator = VoiceOrchestrator()
+    
+    warm_goals = [g.strip() for g in os.getenv("ORCH_WARM_GOALS", "").split(",") if g.strip()]
+    await app.state.orchestrator.warm(warm_goals)
+    
+    # Planning is microseconds and served from the warmed plan cache, so by
+    # default it runs in-process; PLAN_POOL_WORKERS>0 moves /execute planning
+    # onto a process pool for planners expensive enough to pay the IPC cost.
+    pool_workers = int(os.getenv("PLAN_POOL_WORKERS", "0"))
+    app.state.plan_pool = (
+        ProcessPoolExecutor(max_workers=pool_workers, mp_context=multiprocessing.get_context("spawn"))
+        if pool_workers > 0 else None
+    )
+    
+    await startup_event()
+    try:
+        yield
+    finally:
+        await app.state.voice_orchestrator.flush_telemetry()
+        await shutdown_event()
+        app.state.voice_orchestrator.close()
+        if app.state.plan_pool is not None:
+            app.state.plan_pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Initialize FastAPI. Routes with a response_model keep the default response
+# class (pydantic serializes them directly); routes returning plain dicts opt
+# into ORJSONResponse individually.
 app = FastAPI(
     title="Orchestrator Nova",
     description="AI Agent Orchestration Platform on GCP",
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
-# Initialize orchestrators
-orchestrator = Orchestrator()
-voice_orchestrator = VoiceOrchestrator()
+# Serve high-frequency monitoring endpoints from a short-lived response cache
+_RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "2.0"))
+app.add_middleware(
+    ResponseCacheMiddleware,
+    ttls={"/": _RESPONSE_CACHE_TTL, "/health": _RESPONSE_CACHE_TTL, "/status": _RESPONSE_CACHE_TTL}
+)
+
+
+def get_orchestrator(request: Request) -> Orchestrator:
+    """Dependency returning the app-wide orchestrator."""
+    return request.app.state.orchestrator
+
+
+def get_voice_orchestrator(request: Request) -> VoiceOrchestrator:
+    """Dependency returning the app-wide voice orchestrator."""
+    return request.app.state.voice_orchestrator
+
+
+def get_plan_pool(request: Request) -> Optional[ProcessPoolExecutor]:
+    """Dependency returning the planning process pool, if enabled."""
+    return request.app.state.plan_pool
+
+
+# Health check: the database status is refreshed by a background task instead
+# of on every request (responses themselves are cached by ResponseCacheMiddleware)
+_DB_PROBE_INTERVAL = float(os.getenv("HEALTH_DB_PROBE_INTERVAL", "15.0"))
+_DB_STATUS: Dict[str, str] = {"database": "unknown"}
+_background_tasks: Dict[str, asyncio.Task] = {}
+
+
+async def _probe_database() -> str:
+    """Check database connectivity off the event loop."""
+    from src.orchestrator.tools import runs_record_event
+    try:
+        await asyncio.get_running_loop().run_in_executor(
+            None, runs_record_event, "HEALTH_CHECK", {"timestamp": datetime.utcnow().isoformat()}
+        )
+        return "healthy"
+    except Exception:
+        return "unhealthy"
+
+
+async def _refresh_db_status():
+    """Periodically refresh the cached database status."""
+    while True:
+        _DB_STATUS["database"] = await _probe_database()
+        await asyncio.sleep(_DB_PROBE_INTERVAL)
 
 
 # Request/Response models
@@ -91,54 +178,45 @@ class TaskResponse(BaseModel):
 async def health_check():
     """Health check endpoint."""
     try:
-        # Check database connectivity
-        from src.orchestrator.tools import runs_record_event
-        db_status = "healthy"
-        try:
-            runs_record_event("HEALTH_CHECK", {"timestamp": datetime.utcnow().isoformat()})
-        except Exception:
-            db_status = "unhealthy"
-        
         return HealthResponse(
             status="healthy",
             timestamp=datetime.utcnow().isoformat(),
             version="0.1.0",
             services={
-                "database": db_status,
+                "database": _DB_STATUS["database"],
                 "storage": "healthy",
                 "orchestrator": "healthy",
                 "voice": "healthy"
             }
         )
-    except Exception as e:
-        logger.error("Health check failed", error=str(e))
+    except Exception:
+        logger.exception("Health check failed")
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
 
 # Task execution endpoint
 @app.post("/execute", response_model=TaskResponse)
-async def execute_task(request: TaskRequest, background_tasks: BackgroundTasks):
+async def execute_task(
+    request: TaskRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator),
+    plan_pool: Optional[ProcessPoolExecutor] = Depends(get_plan_pool)
+):
     """Execute an orchestration task."""
     try:
         if request.async_execution:
-            # Execute in background
-            task_id = f"task_{int(datetime.utcnow().timestamp())}"
-            background_tasks.add_task(
-                execute_task_async,
-                task_id,
-                request.goal,
-                request.verbose
+            # Hand off to the Celery workers
+            task = await asyncio.get_running_loop().run_in_executor(
+                None, run_plan.delay, request.goal, request.verbose
             )
             return TaskResponse(
                 status="accepted",
-                task_id=task_id,
+                task_id=task.id,
                 goal=request.goal,
                 message=f"Task '{request.goal}' accepted for async execution"
             )
         else:
             # Execute synchronously
-            import asyncio
-            result = await execute_task_sync(request.goal, request.verbose)
+            result = await execute_task_sync(orchestrator, request.goal, request.verbose, plan_pool)
             return TaskResponse(
                 status=result["status"],
                 goal=request.goal,
@@ -147,45 +225,42 @@ async def execute_task(request: TaskRequest, background_tasks: BackgroundTasks):
                 duration_seconds=result.get("duration_seconds")
             )
     except Exception as e:
-        logger.error("Task execution failed", goal=request.goal, error=str(e))
+        logger.exception("Task execution failed", goal=request.goal)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def execute_task_sync(goal: str, verbose: bool) -> Dict[str, Any]:
-    """Execute task synchronously."""
-    start_time = datetime.utcnow()
-    
-    # Plan and execute
-    plan = await orchestrator.plan(goal)
-    results = await orchestrator.act(plan)
-    
-    duration = (datetime.utcnow() - start_time).total_seconds()
-    
+def _task_snapshot(task_id: str) -> Dict[str, Any]:
+    """Read a task's state from the Celery result backend."""
+    result = celery_app.AsyncResult(task_id)
+    state = result.state
     return {
-        "status": "success",
-        "goal": goal,
-        "results": results if verbose else None,
-        "duration_seconds": duration,
-        "message": f"Successfully executed {len(results)} steps"
+        "task_id": task_id,
+        "state": state,
+        "result": result.result if state == "SUCCESS" else None,
+        "error": str(result.result) if state == "FAILURE" else None
     }
 
 
-async def execute_task_async(task_id: str, goal: str, verbose: bool):
-    """Execute task asynchronously."""
-    logger.info("Starting async task", task_id=task_id, goal=goal)
+# Async task status endpoint
+@app.get("/tasks/{task_id}", response_class=ORJSONResponse)
+async def get_task(task_id: str):
+    """Get the state of an asynchronously executed task."""
     try:
-        result = await execute_task_sync(goal, verbose)
-        logger.info("Async task completed", task_id=task_id, status=result["status"])
+        return await asyncio.get_running_loop().run_in_executor(None, _task_snapshot, task_id)
     except Exception as e:
-        logger.error("Async task failed", task_id=task_id, error=str(e))
+        logger.exception("Task status lookup failed", task_id=task_id)
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 # Voice command endpoint
 @app.post("/voice", response_model=Dict[str, Any])
-async def process_voice(request: VoiceRequest):
+async def process_voice(
+    request: VoiceRequest,
+    voice_orchestrator: VoiceOrchestrator = Depends(get_voice_orchestrator)
+):
     """Process a voice command."""
     try:
-        result = await voice_orchestrator.process_voice_command(request.transcript)
+        result = await voice_orchestrator.process_voice_command(request.transcript, request.session_id)
         
         if result.get("status") == "success":
             return {
@@ -201,13 +276,13 @@ async def process_voice(request: VoiceRequest):
                 detail=result.get("error", "Voice processing failed")
             )
     except Exception as e:
-        logger.error("Voice processing failed", transcript=request.transcript, error=str(e))
+        logger.exception("Voice processing failed", transcript=request.transcript)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Status endpoint
-@app.get("/status")
-async def get_status():
+@app.get("/status", response_class=ORJSONResponse)
+async def get_status(orchestrator: Orchestrator = Depends(get_orchestrator)):
     """Get orchestrator status."""
     try:
         summary = orchestrator.get_execution_summary()
@@ -217,40 +292,38 @@ async def get_status():
             "timestamp": datetime.utcnow().isoformat()
         }
     except Exception as e:
-        logger.error("Status check failed", error=str(e))
+        logger.exception("Status check failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Plan endpoint (for preview)
-@app.post("/plan")
-async def create_plan(request: TaskRequest):
+@app.post("/plan", response_class=ORJSONResponse)
+async def create_plan(
+    request: TaskRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Create an execution plan without executing."""
     try:
         plan = await orchestrator.plan(request.goal)
         return {
             "status": "success",
             "goal": request.goal,
-            "plan": plan,
-            "steps_count": len(plan.get("steps", [])),
+            "plan": orchestrator.plan_json(plan),
+            "steps_count": len(plan["steps"]),
             "message": "Plan created successfully"
         }
     except Exception as e:
-        logger.error("Plan creation failed", goal=request.goal, error=str(e))
+        logger.exception("Plan creation failed", goal=request.goal)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup."""
-    logger.info("Orchestrator Nova starting up",
-                project=os.getenv("PROJECT_ID"),
-                region=os.getenv("REGION"))
-    
-    # Verify database connection
+async def _init_database():
+    """Create the event schema and record the STARTUP event off the event loop."""
+    from src.orchestrator.tools import ensure_schema, runs_record_event
     try:
-        from src.orchestrator.tools import runs_record_event
-        runs_record_event("STARTUP", {
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, ensure_schema)
+        await loop.run_in_executor(None, runs_record_event, "STARTUP", {
             "timestamp": datetime.utcnow().isoformat(),
             "version": "0.1.0",
             "environment": os.getenv("ENV", "production")
@@ -260,11 +333,29 @@ async def startup_event():
         logger.warning("Database connection failed on startup", error=str(e))
 
 
-# Shutdown event
-@app.on_event("shutdown")
+# Startup event (run from lifespan)
+async def startup_event():
+    """Initialize services on startup."""
+    logger.info("Orchestrator Nova starting up",
+                project=os.getenv("PROJECT_ID"),
+                region=os.getenv("REGION"))
+    
+    # Create the schema and record startup in the background, so a slow or
+    # unreachable database does not hold up serving
+    _background_tasks["db_startup"] = asyncio.create_task(_init_database())
+    
+    # Keep the health check's database status fresh in the background
+    _background_tasks["db_status"] = asyncio.create_task(_refresh_db_status())
+
+
+# Shutdown event (run from lifespan)
 async def shutdown_event():
     """Clean up on shutdown."""
     logger.info("Orchestrator Nova shutting down")
+    
+    for task in _background_tasks.values():
+        task.cancel()
+    _background_tasks.clear()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+"""Celery task queue for asynchronous orchestration runs.
+
+Workers are started separately from the API, e.g.:
+
+    celery -A src.api.tasks worker --loglevel=INFO
+"""
+
+import os
+import asyncio
+from functools import lru_cache
+from typing import Dict, Any
+
+from celery import Celery
+import structlog
+
+from src.orchestrator.orchestrator import Orchestrator, execute_task_sync
+
+logger = structlog.get_logger(__name__)
+
+BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
+RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", BROKER_URL)
+
+celery_app = Celery("orchestrator", broker=BROKER_URL, backend=RESULT_BACKEND)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_track_started=True,
+    result_expires=int(os.getenv("CELERY_RESULT_EXPIRES", "86400")),
+)
+
+
+@lru_cache(maxsize=1)
+def _worker_orchestrator():
+    """Per-process orchestrator shared by all tasks on a worker."""
+    return Orchestrator()
+
+
+@celery_app.task(name="orchestrator.run_plan", bind=True)
+def run_plan(self, goal: str, verbose: bool = False) -> Dict[str, Any]:
+    """Plan and execute a goal on a worker process."""
+    logger.info("Starting async task", task_id=self.request.id, goal=goal)
+    try:
+        result = asyncio.run(execute_task_sync(_worker_orchestrator(), goal, verbose))
+        logger.info("Async task completed", task_id=self.request.id, status=result["status"])
+        return result
+    except Exception as e:
+        logger.error("Async task failed", task_id=self.request.id, error=str(e))
+        raise
@@ -4,15 +4,25 @@ __version__ = "0.1.0"
 __author__ = "Chase (AdaptNova)"
 
 from .orchestrator import Orchestrator
+from .events import EventBatcher
 from .tools import (
     runs_record_event,
+    runs_record_events_bulk,
+    decode_event_details,
     artifacts_write_text,
+    artifact_object_key,
     etl_run_job,
+    etl_run_job_async,
 )
 
 __all__ = [
     "Orchestrator",
+    "EventBatcher",
     "runs_record_event",
+    "runs_record_events_bulk",
+    "decode_event_details",
     "artifacts_write_text",
+    "artifact_object_key",
     "etl_run_job",
+    "etl_run_job_async",
 ]
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Batched run-event recording for Orchestrator Nova."""
+
+import asyncio
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import structlog
+
+from .tools import runs_record_events_bulk
+
+logger = structlog.get_logger(__name__)
+
+# Queued by stop() to make the flush loop write what it has and exit
+_STOP = object()
+
+
+class EventBatcher:
+    """
+    Buffer run events in memory and write them in batches.
+
+    Events are submitted without blocking and written by a background task
+    whenever ``max_batch`` events are buffered or ``max_delay`` seconds have
+    passed since the first buffered event, whichever comes first. Each event
+    is stamped with ``time.time_ns()`` on submit; timestamps are only converted
+    to datetimes when the batch is written.
+    """
+
+    def __init__(self, max_batch: int = 500, max_delay: float = 0.2, maxsize: int = 10_000):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the flush loop is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the background flush loop on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    def submit(self, event_type: str, details: Dict[str, Any]) -> bool:
+        """Queue an event for recording; returns False if it was dropped."""
+        try:
+            self._queue.put_nowait((event_type, details, time.time_ns()))
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Event queue full, dropping event", event_type=event_type)
+            return False
+
+    async def stop(self):
+        """Flush all queued events and stop the flush loop."""
+        if self.running:
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
+
+        # Events submitted while the loop was not running
+        batch = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                batch.append(item)
+        for i in range(0, len(batch), self.max_batch):
+            await self._write(batch[i:i + self.max_batch])
+
+    async def _flush_loop(self):
+        """Collect events into batches and write them."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stopping = False
+            deadline = loop.time() + self.max_delay
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._write(batch)
+
+            if stopping:
+                return
+
+    async def _write(self, batch: List[Tuple[str, Dict[str, Any], int]]):
+        """Write a batch of events, logging rather than raising on failure."""
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, runs_record_events_bulk, batch)
+        except Exception as e:
+            logger.warning("Failed to record events", count=len(batch), error=str(e))
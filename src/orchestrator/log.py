@@ -0,0 +1,20 @@
+"""Logging helpers shared across Orchestrator Nova."""
+
+import logging
+from typing import Any
+
+import orjson
+import structlog
+
+# Level checks use the package logger; module loggers inherit its level
+_stdlib_logger = logging.getLogger(__name__.rpartition(".")[0] or __name__)
+
+
+def info_enabled() -> bool:
+    """Whether INFO events would be emitted (mirrors structlog's filter_by_level)."""
+    return not structlog.is_configured() or _stdlib_logger.isEnabledFor(logging.INFO)
+
+
+def orjson_dumps(obj: Any, default: Any) -> str:
+    """Serialize log events with orjson for JSONRenderer (structlog expects ``str``)."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z).decode()
@@ -3,14 +3,14 @@
 
 import os
 import sys
-import json
 import asyncio
 import logging
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 import click
+import orjson
 import structlog
 from dotenv import load_dotenv
 from rich.console import Console
@@ -19,12 +19,14 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .orchestrator import Orchestrator
 from .tools import runs_record_event, artifacts_write_text, etl_run_job
+from .log import orjson_dumps
 
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent / ".claude/projects/agents-gcp/.env"
 if env_path.exists():
     load_dotenv(env_path)
 
+
 # Configure structured logging
 structlog.configure(
     processors=[
@@ -36,7 +38,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -56,76 +58,51 @@ class OrchestrationEngine:
         
     async def execute_task(self, goal: str, verbose: bool = False) -> Dict[str, Any]:
         """Execute a task with the given goal."""
-        start_time = datetime.utcnow()
-        
-        # Record start event
-        await self._record_event("TASK_START", {"goal": goal, "timestamp": start_time.isoformat()})
+        start = time.perf_counter()
         
         try:
-            # Plan the task
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=self.console,
             ) as progress:
                 plan_task = progress.add_task("[cyan]Planning task...", total=None)
-                plan = await self.orchestrator.plan(goal)
-                progress.update(plan_task, completed=True)
+                exec_task = None
                 
-            if verbose:
-                self._display_plan(plan)
-            
-            # Execute the plan
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            ) as progress:
-                exec_task = progress.add_task("[green]Executing plan...", total=len(plan["steps"]))
-                results = []
+                async def show_plan(plan: Dict[str, Any]):
+                    nonlocal exec_task
+                    progress.update(plan_task, total=1, completed=1)
+                    if verbose:
+                        self._display_plan(plan)
+                    exec_task = progress.add_task("[green]Executing plan...", total=len(plan["steps"]))
                 
-                for i, step in enumerate(plan["steps"]):
-                    result = await self.orchestrator.execute_step(step)
-                    results.append(result)
+                async def report_step(index: int, tool: str, result: Dict[str, Any]):
                     progress.update(exec_task, advance=1)
-                    
                     if verbose:
-                        self.console.print(f"  ✓ {step['tool']}: {result.get('status', 'unknown')}")
-            
-            # Record completion
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-            
-            await self._record_event("TASK_COMPLETE", {
-                "goal": goal,
-                "duration_seconds": duration,
-                "steps_completed": len(results),
-                "timestamp": end_time.isoformat()
-            })
+                        self.console.print(f"  ✓ {tool}: {result.get('status', 'unknown')}")
+                
+                # Start, completion and error events are recorded by the orchestrator
+                plan, results = await self.orchestrator.execute_with_telemetry(
+                    goal,
+                    source="cli",
+                    on_plan=show_plan,
+                    on_step=report_step
+                )
             
             return {
                 "status": "success",
                 "goal": goal,
                 "plan": plan,
                 "results": results,
-                "duration_seconds": duration
+                "duration_seconds": time.perf_counter() - start
             }
             
         except Exception as e:
             logger.error("Task execution failed", goal=goal, error=str(e))
-            await self._record_event("TASK_ERROR", {
-                "goal": goal,
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            })
             raise
-    
-    async def _record_event(self, event_type: str, details: Dict[str, Any]):
-        """Record an event to the database."""
-        try:
-            await asyncio.to_thread(runs_record_event, event_type, details)
-        except Exception as e:
-            logger.warning("Failed to record event", event_type=event_type, error=str(e))
+        
+        finally:
+            await self.orchestrator.events.stop()
     
     def _display_plan(self, plan: Dict[str, Any]):
         """Display the execution plan in a table."""
@@ -135,10 +112,10 @@ class OrchestrationEngine:
         table.add_column("Arguments", style="green")
         
         for i, step in enumerate(plan["steps"], 1):
-            args_str = json.dumps(step.get("args", {}), indent=2)
+            args_str = orjson.dumps(step.args).decode()
             if len(args_str) > 50:
                 args_str = args_str[:47] + "..."
-            table.add_row(str(i), step["tool"], args_str)
+            table.add_row(str(i), step.tool, args_str)
         
         self.console.print(table)
 
@@ -1,19 +1,101 @@
 """Core Orchestrator class for task planning and execution."""
 
 import asyncio
-import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import copy
+import re
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Awaitable, Callable, Deque, Dict, Any, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
 from enum import Enum
 
+import orjson
 import structlog
 from pydantic import BaseModel, Field
 
-from .tools import get_tool, TOOL_REGISTRY
+from .events import EventBatcher
+from .log import info_enabled
+from .tools import get_tool, tool_clients_warm, warm_tool_clients, NON_BLOCKING_TOOLS, TOOL_REGISTRY
 
 logger = structlog.get_logger(__name__)
 
 
+# Plan templates are cached per goal; the timestamp placeholder in artifact
+# paths is filled in each time a cached template is materialized.
+_PLAN_CACHE_SIZE = 512
+_EXECUTION_HISTORY_SIZE = 10_000
+_TS_PLACEHOLDER = "{TS}"
+
+# Called by act() as each step finishes, with (step index, tool name, result)
+StepCallback = Callable[[int, str, Dict[str, Any]], Awaitable[None]]
+# Called by execute_with_telemetry() with the plan before it is executed
+PlanCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Goal keyword router. Each alternative is a lookahead anchored at the start
+# of the goal, so buckets keep their priority (etl > train > deploy) no matter
+# where in the goal the keywords appear; ``lastgroup`` names the bucket.
+_GOAL_ROUTER = re.compile(
+    r"(?=.*?(?P<etl>etl|data|pipeline))"
+    r"|(?=.*?(?P<train>train|model))"
+    r"|(?=.*?(?P<deploy>deploy|agent))",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Static step templates as (tool, args, depends_on). String values in args are
+# str.format_map templates over {goal}, {goal_json} and {ts}; {ts} renders to
+# the timestamp placeholder so it can be filled per materialization.
+_PLAN_START_STEP = ("runs_record_event", {"event_type": "PLAN", "details": {"goal": "{goal}"}}, ())
+_PLAN_DONE_STEP = ("runs_record_event", {"event_type": "DONE", "details": {"goal": "{goal}"}})
+
+_BUCKET_STEPS = {
+    "etl": (
+        ("etl_run_job", {"payload": {"goal": "{goal}", "pipeline": "default"}}, (0,)),
+        ("artifacts_write_text", {
+            "path": "etl/results/{ts}.json",
+            "content": '{{"goal":{goal_json},"status":"completed"}}'
+        }, (1,)),
+    ),
+    "train": (
+        ("train_model", {
+            "model_name": "orchestrator-model",
+            "config": {"epochs": 10, "batch_size": 32}
+        }, (0,)),
+        ("artifacts_write_text", {
+            "path": "training/logs/{ts}.txt",
+            "content": "Training initiated for goal: {goal}"
+        }, (1,)),
+    ),
+    "deploy": (
+        ("deploy_agent", {
+            "agent_name": "orchestrator-nova",
+            "version": "v1.0.0",
+            "config": {"replicas": 1, "memory": "2Gi"}
+        }, (0,)),
+    ),
+    # Default workflow
+    "default": (
+        ("etl_run_job", {"payload": {"goal": "{goal}", "type": "generic"}}, (0,)),
+        ("artifacts_write_text", {
+            "path": "runs/{ts}.txt",
+            "content": "Goal: {goal}\nStatus: Processing"
+        }, (1,)),
+    ),
+}
+
+
+def _render_args(value: Any, fields: Dict[str, str]) -> Any:
+    """Fill a step args template, returning fresh containers."""
+    if isinstance(value, str):
+        return value.format_map(fields)
+    if isinstance(value, dict):
+        return {key: _render_args(item, fields) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_render_args(item, fields) for item in value]
+    return value
+
+
 class TaskStatus(str, Enum):
     """Task execution status."""
     PENDING = "pending"
@@ -43,13 +125,20 @@ class TaskPlan(BaseModel):
 class Orchestrator:
     """Main orchestrator for task planning and execution."""
     
-    def __init__(self):
+    def __init__(self, events: Optional[EventBatcher] = None):
         self.logger = logger
+        # Telemetry written by execute_with_telemetry(); callers flush it with events.stop()
+        self.events = events if events is not None else EventBatcher()
         self.tools = TOOL_REGISTRY
+        self._tool_names = frozenset(self.tools)
         self.current_plan: Optional[TaskPlan] = None
-        self.execution_history: List[Dict[str, Any]] = []
+        self.execution_history: Deque[Dict[str, Any]] = deque(maxlen=_EXECUTION_HISTORY_SIZE)
+        self._success_count = 0
+        self._failed_count = 0
+        self._plan_cache: "OrderedDict[str, TaskPlan]" = OrderedDict()
+        self._warm_task: Optional[asyncio.Task] = None
     
-    async def plan(self, goal: str) -> Dict[str, Any]:
+    async def plan(self, goal: str, materialize: bool = True) -> Dict[str, Any]:
         """
         Create an execution plan for the given goal.
         
@@ -58,90 +147,175 @@ class Orchestrator:
         - Task decomposition algorithms
         - Dependency analysis
         - Resource optimization
+        
+        With materialize=False only what act() needs is built: no TaskPlan
+        model, ``created_at`` or ``current_plan`` update.
         """
+        return self.plan_sync(goal, materialize)
+    
+    def plan_sync(self, goal: str, materialize: bool = True) -> Dict[str, Any]:
+        """Synchronous implementation of plan() for executor and worker use."""
         self.logger.info("Creating plan", goal=goal)
         
-        # Determine plan based on goal keywords
-        steps = []
+        template = self._plan_template(goal)
+        ts = str(time.time_ns() // 1_000_000_000)
+        steps = [self._materialize_step(step, ts) for step in template.steps]
         
-        # Always start with recording the plan
-        steps.append(TaskStep(
-            tool="runs_record_event",
-            args={"event_type": "PLAN", "details": {"goal": goal}}
-        ))
+        if not materialize:
+            return {"goal": template.goal, "steps": steps, "metadata": dict(template.metadata)}
         
-        # Analyze goal and add appropriate steps
-        goal_lower = goal.lower()
+        plan = TaskPlan(
+            goal=template.goal,
+            steps=steps,
+            metadata=dict(template.metadata)
+        )
         
-        if "etl" in goal_lower or "data" in goal_lower or "pipeline" in goal_lower:
-            steps.append(TaskStep(
-                tool="etl_run_job",
-                args={"payload": {"goal": goal, "pipeline": "default"}},
-                depends_on=[0]
-            ))
-            steps.append(TaskStep(
-                tool="artifacts_write_text",
-                args={
-                    "path": f"etl/results/{int(datetime.utcnow().timestamp())}.json",
-                    "content": json.dumps({"goal": goal, "status": "completed"})
-                },
-                depends_on=[1]
-            ))
+        self.current_plan = plan
         
-        elif "train" in goal_lower or "model" in goal_lower:
-            steps.append(TaskStep(
-                tool="train_model",
-                args={
-                    "model_name": "orchestrator-model",
-                    "config": {"epochs": 10, "batch_size": 32}
-                },
-                depends_on=[0]
-            ))
-            steps.append(TaskStep(
-                tool="artifacts_write_text",
-                args={
-                    "path": f"training/logs/{int(datetime.utcnow().timestamp())}.txt",
-                    "content": f"Training initiated for goal: {goal}"
-                },
-                depends_on=[1]
-            ))
+        # Steps stay TaskStep models for in-process callers; use plan_json()
+        # to serialize at the HTTP boundary.
+        return {
+            "goal": plan.goal,
+            "steps": plan.steps,
+            "metadata": plan.metadata,
+            "created_at": plan.created_at.isoformat()
+        }
+    
+    def record_event(self, event_type: str, details: Dict[str, Any]):
+        """Queue a run event for the background batch writer."""
+        # Started lazily: the orchestrator may be built before the loop runs
+        if not self.events.running:
+            self.events.start()
+        self.events.submit(event_type, details)
+    
+    async def execute_with_telemetry(
+        self,
+        goal: str,
+        source: str,
+        start_event: str = "TASK_START",
+        complete_event: str = "TASK_COMPLETE",
+        error_event: str = "TASK_ERROR",
+        on_plan: Optional[PlanCallback] = None,
+        on_step: Optional[StepCallback] = None,
+        materialize: bool = True
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Plan and run a goal, recording start and completion events around it.
+        
+        Cold tool clients are warmed in the background rather than awaited,
+        so steps that need no client start right away; ``materialize`` is passed to plan(), ``on_plan`` is awaited
+        with the plan before it runs and ``on_step`` is passed to act(). If
+        planning or execution raises, ``error_event`` is recorded and the
+        exception propagates. Returns the plan and the step results from act().
+        """
+        start = time.perf_counter()
+        self.record_event(start_event, {"goal": goal, "source": source})
         
-        elif "deploy" in goal_lower or "agent" in goal_lower:
-            steps.append(TaskStep(
-                tool="deploy_agent",
-                args={
-                    "agent_name": "orchestrator-nova",
-                    "version": "v1.0.0",
-                    "config": {"replicas": 1, "memory": "2Gi"}
-                },
-                depends_on=[0]
-            ))
+        if not tool_clients_warm():
+            self._start_warming_tool_clients()
         
+        try:
+            plan = await self.plan(goal, materialize=materialize)
+            
+            if on_plan is not None:
+                await on_plan(plan)
+            
+            results = await self.act(plan, on_step=on_step)
+        except Exception as e:
+            self.record_event(error_event, {"goal": goal, "source": source, "error": str(e)})
+            raise
+        
+        self.record_event(complete_event, {
+            "goal": goal,
+            "steps_completed": len(results),
+            "duration_seconds": time.perf_counter() - start,
+            "status": "success"
+        })
+        return plan, results
+    
+    def _start_warming_tool_clients(self):
+        """Create the tools' database pool and storage client on a worker thread, unless already underway."""
+        if self._warm_task is None or self._warm_task.done():
+            self._warm_task = asyncio.ensure_future(
+                asyncio.get_running_loop().run_in_executor(None, warm_tool_clients)
+            )
+    
+    @staticmethod
+    def plan_json(plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a JSON-compatible copy of a plan returned by plan()."""
+        return {
+            **plan,
+            "steps": [
+                step.model_dump(mode="json") if isinstance(step, TaskStep) else step
+                for step in plan["steps"]
+            ]
+        }
+    
+    @staticmethod
+    def _as_step(step: Any) -> TaskStep:
+        """Return ``step`` as a TaskStep, validating only plain dicts."""
+        return step if isinstance(step, TaskStep) else TaskStep(**step)
+    
+    async def warm(self, goals: Iterable[str] = ()):
+        """Prime the plan cache so the first requests for ``goals`` are not cold."""
+        for goal in goals:
+            self._plan_template(goal)
+        self.logger.info("Orchestrator warmed", plan_cache_size=len(self._plan_cache))
+    
+    def _plan_template(self, goal: str) -> TaskPlan:
+        """Return the cached plan template for a goal, building it on a miss."""
+        template = self._plan_cache.get(goal)
+        if template is None:
+            template = self._build_plan_template(goal)
+            self._plan_cache[goal] = template
+            if len(self._plan_cache) > _PLAN_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
         else:
-            # Default workflow
-            steps.append(TaskStep(
-                tool="etl_run_job",
-                args={"payload": {"goal": goal, "type": "generic"}},
-                depends_on=[0]
-            ))
-            steps.append(TaskStep(
-                tool="artifacts_write_text",
-                args={
-                    "path": f"runs/{int(datetime.utcnow().timestamp())}.txt",
-                    "content": f"Goal: {goal}\nStatus: Processing"
-                },
-                depends_on=[1]
-            ))
+            self._plan_cache.move_to_end(goal)
+        return template
+    
+    @staticmethod
+    def _materialize_step(step: TaskStep, ts: str) -> TaskStep:
+        """
+        Copy a template step, filling in the timestamp placeholder.
+        
+        model_copy() is shallow, so every mutable field is copied here;
+        nothing in the returned step is shared with the cached template.
+        """
+        args = copy.deepcopy(step.args)
+        path = args.get("path")
+        if isinstance(path, str) and _TS_PLACEHOLDER in path:
+            args["path"] = path.replace(_TS_PLACEHOLDER, ts)
+        return step.model_copy(update={"args": args, "depends_on": list(step.depends_on)})
+    
+    def _build_plan_template(self, goal: str) -> TaskPlan:
+        """Build the timestamp-independent plan for a goal."""
+        fields = {
+            "goal": goal,
+            "goal_json": orjson.dumps(goal).decode(),
+            "ts": _TS_PLACEHOLDER
+        }
+        
+        # Analyze goal and pick the matching step templates
+        match = _GOAL_ROUTER.match(goal)
+        bucket = match.lastgroup if match else "default"
+        
+        # Always start with recording the plan
+        steps = [
+            TaskStep(tool=tool, args=_render_args(args, fields), depends_on=list(depends_on))
+            for tool, args, depends_on in (_PLAN_START_STEP, *_BUCKET_STEPS[bucket])
+        ]
         
         # Always end with recording completion
+        tool, args = _PLAN_DONE_STEP
         steps.append(TaskStep(
-            tool="runs_record_event",
-            args={"event_type": "DONE", "details": {"goal": goal}},
+            tool=tool,
+            args=_render_args(args, fields),
             depends_on=[len(steps) - 1] if len(steps) > 1 else []
         ))
         
         # Create plan
-        plan = TaskPlan(
+        return TaskPlan(
             goal=goal,
             steps=steps,
             metadata={
@@ -149,31 +323,30 @@ class Orchestrator:
                 "estimated_duration_seconds": len(steps) * 5
             }
         )
-        
-        self.current_plan = plan
-        
-        return {
-            "goal": plan.goal,
-            "steps": [step.dict() for step in plan.steps],
-            "metadata": plan.metadata,
-            "created_at": plan.created_at.isoformat()
-        }
     
-    async def execute_step(self, step: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a single step from the plan."""
-        step_obj = TaskStep(**step) if isinstance(step, dict) else step
+    async def execute_step(self, step: Any) -> Dict[str, Any]:
+        """Execute a single step (a TaskStep or its dict form) from the plan."""
+        step_obj = self._as_step(step)
         
-        self.logger.info("Executing step", tool=step_obj.tool, args=step_obj.args)
+        if info_enabled():
+            self.logger.info("Executing step", tool=step_obj.tool, args=step_obj.args)
         
         try:
             # Get the tool function
             tool_func = get_tool(step_obj.tool)
             
-            # Execute with timeout
-            result = await asyncio.wait_for(
-                asyncio.to_thread(tool_func, **step_obj.args),
-                timeout=step_obj.timeout
-            )
+            if step_obj.tool in NON_BLOCKING_TOOLS:
+                # Cheap sync tools run inline; a thread hop costs more than the call
+                result = tool_func(**step_obj.args)
+            else:
+                # Async tools run on the event loop; blocking ones in a thread
+                if asyncio.iscoroutinefunction(tool_func):
+                    call = tool_func(**step_obj.args)
+                else:
+                    call = asyncio.to_thread(tool_func, **step_obj.args)
+                
+                # Execute with timeout
+                result = await asyncio.wait_for(call, timeout=step_obj.timeout)
             
             # Record execution
             self.execution_history.append({
@@ -181,8 +354,9 @@ class Orchestrator:
                 "args": step_obj.args,
                 "result": result,
                 "status": "success",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             })
+            self._success_count += 1
             
             return result
             
@@ -195,56 +369,102 @@ class Orchestrator:
             }
         
         except Exception as e:
-            self.logger.error("Step failed", tool=step_obj.tool, error=str(e))
+            error = str(e)
+            self.logger.error("Step failed", tool=step_obj.tool, error=error)
             
             # Record failure
             self.execution_history.append({
                 "tool": step_obj.tool,
                 "args": step_obj.args,
-                "error": str(e),
+                "error": error,
                 "status": "failed",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             })
+            self._failed_count += 1
             
             # Retry logic would go here
             return {
                 "status": "error",
                 "tool": step_obj.tool,
-                "error": str(e)
+                "error": error
             }
     
-    async def act(self, plan: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Execute all steps in a plan."""
-        results = []
+    async def act(
+        self,
+        plan: Dict[str, Any],
+        on_step: Optional[StepCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute all steps in a plan, running independent steps concurrently.
         
-        for step in plan["steps"]:
-            result = await self.execute_step(step)
-            results.append({
-                "tool": step["tool"],
-                "result": result
-            })
+        If given, ``on_step`` is awaited as soon as each step finishes, before
+        the rest of its dependency level, so callers can report progress.
+        """
+        steps = [self._as_step(step) for step in plan["steps"]]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(steps)
+        
+        async def run_step(i: int) -> Dict[str, Any]:
+            result = await self.execute_step(steps[i])
+            await on_step(i, steps[i].tool, result)
+            return result
+        
+        for indices in self.dependency_levels(steps):
+            level_results = await asyncio.gather(
+                *(self.execute_step(steps[i]) if on_step is None else run_step(i) for i in indices)
+            )
             
-            # Stop on critical failure
-            if result.get("status") == "error" and step["tool"] == "runs_record_event":
-                self.logger.warning("Critical step failed, continuing anyway", tool=step["tool"])
+            for i, result in zip(indices, level_results):
+                step = steps[i]
+                results[i] = {
+                    "tool": step.tool,
+                    "result": result
+                }
+                
+                # Stop on critical failure
+                if result.get("status") == "error" and step.tool == "runs_record_event":
+                    self.logger.warning("Critical step failed, continuing anyway", tool=step.tool)
         
         return results
     
+    @staticmethod
+    def dependency_levels(steps: List[TaskStep]) -> List[List[int]]:
+        """
+        Group step indices into dependency levels.
+        
+        Every step in a level depends only on steps from earlier levels, so
+        the steps of one level can be executed concurrently. Indices within a
+        level keep their plan order.
+        """
+        step_levels: List[int] = []
+        levels: List[List[int]] = []
+        
+        for i, step in enumerate(steps):
+            level = 1 + max(
+                (step_levels[dep] for dep in step.depends_on if dep < i),
+                default=-1
+            )
+            step_levels.append(level)
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(i)
+        
+        return levels
+    
     def validate_plan(self, plan: Dict[str, Any]) -> bool:
         """Validate that a plan is executable."""
         try:
-            # Check all tools exist
-            for step in plan["steps"]:
-                if step["tool"] not in self.tools:
-                    self.logger.error("Unknown tool in plan", tool=step["tool"])
-                    return False
+            tool_names = self._tool_names
             
-            # Check dependencies are valid
+            # Single pass: every tool must exist and every dependency must
+            # refer to an earlier step
             for i, step in enumerate(plan["steps"]):
-                for dep in step.get("depends_on", []):
-                    if dep >= i:
-                        self.logger.error("Invalid dependency", step=i, depends_on=dep)
-                        return False
+                step = self._as_step(step)
+                if step.tool not in tool_names:
+                    self.logger.error("Unknown tool in plan", tool=step.tool)
+                    return False
+                if step.depends_on and max(step.depends_on) >= i:
+                    self.logger.error("Invalid dependency", step=i, depends_on=max(step.depends_on))
+                    return False
             
             return True
             
@@ -254,16 +474,70 @@ class Orchestrator:
     
     def get_execution_summary(self) -> Dict[str, Any]:
         """Get summary of execution history."""
-        if not self.execution_history:
+        total = self._success_count + self._failed_count
+        if not total:
             return {"message": "No execution history"}
         
-        successful = sum(1 for h in self.execution_history if h.get("status") == "success")
-        failed = sum(1 for h in self.execution_history if h.get("status") == "failed")
-        
         return {
-            "total_executions": len(self.execution_history),
-            "successful": successful,
-            "failed": failed,
-            "success_rate": successful / len(self.execution_history) if self.execution_history else 0,
-            "last_execution": self.execution_history[-1] if self.execution_history else None
-        }
\ No newline at end of file
+            "total_executions": total,
+            "successful": self._success_count,
+            "failed": self._failed_count,
+            "success_rate": self._success_count / total,
+            "last_execution": self._format_history_entry(self.execution_history[-1]) if self.execution_history else None
+        }
+    
+    @staticmethod
+    def _format_history_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a history entry with its timestamp formatted as ISO 8601."""
+        formatted = dict(entry)
+        timestamp_ns = formatted.pop("timestamp_ns")
+        formatted["timestamp"] = datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+        return formatted
+
+
+@lru_cache(maxsize=1)
+def _process_orchestrator() -> Orchestrator:
+    """Orchestrator owned by the current (worker) process."""
+    return Orchestrator()
+
+
+def plan_goal(goal: str) -> Dict[str, Any]:
+    """
+    Plan a goal with this process's orchestrator.
+    
+    Module-level so it can be pickled and submitted to a ProcessPoolExecutor;
+    each worker process keeps its own plan cache.
+    """
+    return _process_orchestrator().plan_sync(goal)
+
+
+async def execute_task_sync(
+    orchestrator: Orchestrator,
+    goal: str,
+    verbose: bool,
+    plan_pool: Optional[Executor] = None
+) -> Dict[str, Any]:
+    """
+    Plan and execute a goal, returning the API's task result.
+    
+    Shared by the API's synchronous /execute path and the Celery workers.
+    With ``plan_pool`` the goal is planned on it through plan_goal().
+    """
+    start = time.perf_counter()
+    
+    # Plan (on the process pool when available) and execute
+    if plan_pool is not None:
+        plan = await asyncio.get_running_loop().run_in_executor(plan_pool, plan_goal, goal)
+    else:
+        plan = await orchestrator.plan(goal)
+    results = await orchestrator.act(plan)
+    
+    duration = time.perf_counter() - start
+    
+    return {
+        "status": "success",
+        "goal": goal,
+        "results": results if verbose else None,
+        "duration_seconds": duration,
+        "message": f"Successfully executed {len(results)} steps"
+    }
@@ -1,23 +1,44 @@
 """Tool implementations for Orchestrator Nova."""
 
 import os
-import json
+import hashlib
 import time
+import atexit
 import asyncio
-from datetime import datetime
-from typing import Dict, Any, Optional
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+import orjson
 import psycopg
+from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool, PoolTimeout
 from google.cloud import storage
+from google.cloud.storage import retry as storage_retry, transfer_manager
 # from google.cloud.sql.connector import Connector  # Optional, not needed for public IP
+try:
+    import zstandard
+except ImportError:  # Optional: event details are stored uncompressed without it
+    zstandard = None
 import structlog
+from tenacity import (
+    retry,
+    retry_if_exception,
+    retry_if_exception_type,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 logger = structlog.get_logger(__name__)
 
 # Database connection configuration
+@lru_cache(maxsize=1)
 def get_db_connection_string() -> str:
-    """Get the database connection string."""
+    """Get the database connection string (read from the environment once)."""
     # Check if running in Cloud Run/GCP
     if os.getenv("K_SERVICE"):
         # Use Unix socket in GCP
@@ -36,6 +57,227 @@ def get_db_connection_string() -> str:
         )
 
 
+# prepare_threshold=0 prepares every statement on first use, so the hot
+# event insert is parsed and planned once per connection
+_CONNECTION_KWARGS = {"autocommit": False, "prepare_threshold": 0}
+
+def _dumps_details(details: Any) -> bytes:
+    """Serialize event details to JSON for the details JSONB column."""
+    # Naive datetimes in details are emitted as UTC, like run_events.ts
+    return orjson.dumps(details, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
+# Details at least this large (serialized) are stored zstd-compressed in
+# details_zstd instead of as JSONB in details
+DETAILS_COMPRESS_MIN_BYTES = int(os.getenv("DETAILS_COMPRESS_MIN_BYTES", "1024"))
+DETAILS_ZSTD_LEVEL = int(os.getenv("DETAILS_ZSTD_LEVEL", "3"))
+DETAILS_CODEC_ZSTD_JSON = "zstd+json"
+
+# zstd (de)compressors are not safe to share between threads
+_ZSTD_LOCAL = threading.local()
+
+
+def _encode_details(details: Dict[str, Any]) -> Tuple[Optional[Jsonb], Optional[bytes], Optional[str]]:
+    """Encode details as the (details, details_zstd, details_codec) column values."""
+    data = _dumps_details(details)
+    
+    if zstandard is not None and len(data) >= DETAILS_COMPRESS_MIN_BYTES:
+        compressor = getattr(_ZSTD_LOCAL, "compressor", None)
+        if compressor is None:
+            compressor = _ZSTD_LOCAL.compressor = zstandard.ZstdCompressor(level=DETAILS_ZSTD_LEVEL)
+        return None, compressor.compress(data), DETAILS_CODEC_ZSTD_JSON
+    
+    # Already serialized; hand the bytes to the JSONB dumper as they are
+    return Jsonb(data, dumps=bytes), None, None
+
+
+def decode_event_details(
+    details: Optional[Any],
+    details_zstd: Optional[bytes] = None,
+    details_codec: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get the details of a run_events row, decompressing them if needed.
+    
+    Args:
+        details: The row's details column
+        details_zstd: The row's details_zstd column
+        details_codec: The row's details_codec column
+    
+    Returns:
+        Event details as a dictionary
+    """
+    if details_codec is None:
+        return details
+    
+    if details_codec != DETAILS_CODEC_ZSTD_JSON:
+        raise ValueError(f"Unknown details codec: {details_codec}")
+    if zstandard is None:
+        raise RuntimeError("zstandard is required to read compressed event details")
+    
+    decompressor = getattr(_ZSTD_LOCAL, "decompressor", None)
+    if decompressor is None:
+        decompressor = _ZSTD_LOCAL.decompressor = zstandard.ZstdDecompressor()
+    return orjson.loads(decompressor.decompress(details_zstd))
+
+
+_POOL: Optional[ConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+# Seconds a caller waits for a pooled connection before PoolTimeout; kept
+# short so an unreachable database fails fast instead of stalling callers
+_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "5"))
+
+
+def get_db_pool() -> ConnectionPool:
+    """Get the process-wide database connection pool, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ConnectionPool(
+                    get_db_connection_string(),
+                    min_size=int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+                    max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                    kwargs=_CONNECTION_KWARGS,
+                    timeout=_POOL_TIMEOUT,
+                    open=True,
+                )
+                atexit.register(_POOL.close)
+    return _POOL
+
+
+RUN_EVENTS_DDL = """
+    CREATE TABLE IF NOT EXISTS run_events (
+        id BIGSERIAL PRIMARY KEY,
+        ts TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        event_type TEXT NOT NULL,
+        details JSONB,
+        details_zstd BYTEA,
+        details_codec TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+RUN_EVENTS_COLUMNS_SQL = """
+    SELECT column_name, is_nullable FROM information_schema.columns
+    WHERE table_schema = current_schema() AND table_name = 'run_events'
+"""
+
+
+def _run_events_migrations(columns: Dict[str, str]) -> List[str]:
+    """
+    Get the ALTERs a run_events table created before the compressed columns needs.
+    
+    Only missing changes are returned, so an up-to-date table takes no
+    ACCESS EXCLUSIVE lock (and needs no ownership) at startup.
+    """
+    statements = []
+    if "details_zstd" not in columns:
+        statements.append("ALTER TABLE run_events ADD COLUMN IF NOT EXISTS details_zstd BYTEA")
+    if "details_codec" not in columns:
+        statements.append("ALTER TABLE run_events ADD COLUMN IF NOT EXISTS details_codec TEXT")
+    if columns.get("details") == "NO":
+        statements.append("ALTER TABLE run_events ALTER COLUMN details DROP NOT NULL")
+    return statements
+
+INSERT_EVENT_SQL = """
+    INSERT INTO run_events (ts, event_type, details, details_zstd, details_codec)
+    VALUES (%s, %s, %s, %s, %s)
+    RETURNING id
+"""
+
+_SCHEMA_READY = False
+_SCHEMA_LOCK = threading.Lock()
+
+
+def _ensure_schema(conn: psycopg.Connection):
+    """Create the run_events table once per process rather than per event."""
+    global _SCHEMA_READY
+    if _SCHEMA_READY:
+        return
+    with _SCHEMA_LOCK:
+        if _SCHEMA_READY:
+            return
+        with conn.cursor() as cur:
+            cur.execute(RUN_EVENTS_COLUMNS_SQL, prepare=False)
+            columns = dict(cur.fetchall())
+            statements = _run_events_migrations(columns) if columns else [RUN_EVENTS_DDL]
+            for statement in statements:
+                cur.execute(statement, prepare=False)
+        conn.commit()
+        _SCHEMA_READY = True
+
+
+def ensure_schema():
+    """
+    Create the run_events table up front so no event insert pays for the DDL.
+    
+    Intended to be called once at service startup; event writers still fall
+    back to creating the table on first use.
+    """
+    with get_db_pool().connection() as conn:
+        _ensure_schema(conn)
+
+
+# Transient failures are retried with jittered exponential backoff. Each DB
+# attempt takes a fresh pooled connection, so a broken one is not reused.
+# PoolTimeout (an OperationalError) is not retried: the pool has already
+# waited for a connection, and retrying would multiply that wait.
+_RETRY_ATTEMPTS = int(os.getenv("TOOL_RETRY_ATTEMPTS", "3"))
+
+_retry_db = retry(
+    retry=(
+        retry_if_exception_type(psycopg.OperationalError)
+        & retry_if_not_exception_type(PoolTimeout)
+    ),
+    wait=wait_exponential_jitter(initial=0.1, max=2),
+    stop=stop_after_attempt(_RETRY_ATTEMPTS),
+    reraise=True,
+)
+
+# Storage errors are retried on the client library's own predicate, which
+# covers 408/429/5xx responses (including mid-upload ones) and the requests,
+# urllib3 and http.client transport errors GCS calls actually raise
+_retry_gcs = retry(
+    retry=retry_if_exception(storage_retry.DEFAULT_RETRY._predicate),
+    wait=wait_exponential_jitter(initial=0.2, max=5),
+    stop=stop_after_attempt(_RETRY_ATTEMPTS),
+    reraise=True,
+)
+
+
+@_retry_db
+def _do_insert(ts: datetime, event_type: str, details: Dict[str, Any]) -> int:
+    """Insert one run event and return its id."""
+    with get_db_pool().connection() as conn:
+        _ensure_schema(conn)
+        
+        with conn.cursor(binary=True) as cur:
+            # run_events.ts is a naive UTC TIMESTAMP
+            cur.execute(
+                INSERT_EVENT_SQL,
+                (ts.replace(tzinfo=None), event_type, *_encode_details(details))
+            )
+            run_id = cur.fetchone()[0]
+        conn.commit()
+    return run_id
+
+
+@_retry_db
+def _do_copy(events: List[Tuple[str, Dict[str, Any], int]]):
+    """COPY a batch of run events in one transaction."""
+    with get_db_pool().connection() as conn:
+        _ensure_schema(conn)
+        
+        with conn.cursor() as cur:
+            with cur.copy("COPY run_events (ts, event_type, details, details_zstd, details_codec) FROM STDIN") as copy:
+                for event_type, details, timestamp_ns in events:
+                    # run_events.ts is a naive UTC TIMESTAMP
+                    ts = datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).replace(tzinfo=None)
+                    copy.write_row((ts, event_type, *_encode_details(details)))
+        conn.commit()
+
+
 def runs_record_event(event_type: str, details: Dict[str, Any]) -> Dict[str, Any]:
     """
     Record a run event in PostgreSQL.
@@ -48,87 +290,267 @@ def runs_record_event(event_type: str, details: Dict[str, Any]) -> Dict[str, Any
         Dictionary with status and run_event_id
     """
     try:
-        conn_str = get_db_connection_string()
+        now = datetime.now(timezone.utc)
+        run_id = _do_insert(now, event_type, details)
+        
+        logger.info("Event recorded", event_type=event_type, run_id=run_id)
+        
+        return {
+            "status": "success",
+            "run_event_id": run_id,
+            "timestamp": now.isoformat()
+        }
         
-        with psycopg.connect(conn_str) as conn:
-            with conn.cursor() as cur:
-                # Create table if not exists
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS run_events (
-                        id BIGSERIAL PRIMARY KEY,
-                        ts TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                        event_type TEXT NOT NULL,
-                        details JSONB NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Insert event
-                cur.execute(
-                    """
-                    INSERT INTO run_events (ts, event_type, details) 
-                    VALUES (%s, %s, %s) 
-                    RETURNING id
-                    """,
-                    (datetime.utcnow(), event_type, json.dumps(details))
-                )
-                
-                run_id = cur.fetchone()[0]
-                conn.commit()
-                
-                logger.info("Event recorded", event_type=event_type, run_id=run_id)
-                
-                return {
-                    "status": "success",
-                    "run_event_id": run_id,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
     except Exception as e:
         logger.error("Failed to record event", event_type=event_type, error=str(e))
         raise
 
 
-def artifacts_write_text(path: str, content: str) -> Dict[str, Any]:
+def runs_record_events_bulk(events: List[Tuple[str, Dict[str, Any], int]]) -> Dict[str, Any]:
+    """
+    Record several run events in PostgreSQL with a single COPY.
+    
+    This is the primary API for high-frequency event logging; see
+    EventBatcher for the asynchronous batching front end.
+    
+    Args:
+        events: List of (event_type, details, timestamp_ns) tuples, where
+            timestamp_ns is the event time from time.time_ns()
+    
+    Returns:
+        Dictionary with status and number of events recorded
+    """
+    if not events:
+        return {"status": "success", "count": 0}
+    
+    try:
+        _do_copy(events)
+        
+        logger.info("Events recorded", count=len(events))
+        
+        return {
+            "status": "success",
+            "count": len(events),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        
+    except Exception as e:
+        logger.error("Failed to record events", count=len(events), error=str(e))
+        raise
+
+
+_GCS_CLIENT: Optional[storage.Client] = None
+_GCS_BUCKETS: Dict[str, storage.Bucket] = {}
+_GCS_LOCK = threading.Lock()
+
+
+def _gcs_client() -> storage.Client:
+    """Get the process-wide Cloud Storage client, creating it on first use."""
+    global _GCS_CLIENT
+    if _GCS_CLIENT is None:
+        with _GCS_LOCK:
+            if _GCS_CLIENT is None:
+                _GCS_CLIENT = storage.Client(project=os.environ.get("PROJECT_ID", "echovaeris"))
+    return _GCS_CLIENT
+
+
+@lru_cache(maxsize=1)
+def _bucket_name() -> str:
+    """Get the artifact bucket name (read from the environment once)."""
+    bucket_name = os.environ.get("GCS_BUCKET", f"orchestrator-{os.environ.get('PROJECT_ID', 'echovaeris')}-{os.environ.get('REGION', 'us-central1')}")
+    
+    # Remove gs:// prefix if present
+    if bucket_name.startswith("gs://"):
+        bucket_name = bucket_name[5:].rstrip("/")
+    
+    return bucket_name
+
+
+def _gcs_bucket(name: str) -> storage.Bucket:
+    """Get a cached bucket handle by name."""
+    bucket = _GCS_BUCKETS.get(name)
+    if bucket is None:
+        bucket = _GCS_BUCKETS.setdefault(name, _gcs_client().bucket(name))
+    return bucket
+
+
+def warm_tool_clients():
+    """
+    Create the process-wide database pool and Cloud Storage client ahead of use.
+    
+    Client construction (credential discovery, pool startup) otherwise lands
+    on the first tool call. Failures are logged, not raised; the tools will
+    retry on first use.
+    """
+    try:
+        get_db_pool()
+        _gcs_client()
+    except Exception as e:
+        logger.warning("Failed to warm tool clients", error=str(e))
+
+
+def tool_clients_warm() -> bool:
+    """Whether warm_tool_clients has nothing left to create."""
+    return _POOL is not None and _GCS_CLIENT is not None
+
+
+# Artifact upload strategy thresholds (by content length)
+_RESUMABLE_UPLOAD_THRESHOLD = 8 * 1024 * 1024
+_PARALLEL_UPLOAD_THRESHOLD = 100 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+_PARALLEL_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+# Characters encoded per piece when streaming large artifacts
+_ENCODE_PIECE_SIZE = 1024 * 1024
+
+
+_TEXT_CONTENT_TYPE = "text/plain; charset=utf-8"
+
+
+def _write_utf8(f, content: str) -> int:
+    """Encode content to a binary file piece by piece; returns bytes written."""
+    size = 0
+    for i in range(0, len(content), _ENCODE_PIECE_SIZE):
+        size += f.write(content[i:i + _ENCODE_PIECE_SIZE].encode("utf-8"))
+    return size
+
+
+def _abort_upload(raw) -> None:
+    """Cancel a blob writer's resumable session without finalizing the object."""
+    try:
+        raw.terminate()
+    except Exception as e:
+        logger.warning("Failed to cancel resumable upload", error=str(e))
+        # Mark the writer closed regardless, so nothing finalizes it later
+        raw._buffer.close()
+
+
+@_retry_gcs
+def _do_upload(blob: storage.Blob, content: str, if_generation_match: Optional[int] = None) -> int:
+    """
+    Upload text to a blob, picking the transfer strategy by size.
+    
+    Small payloads use a single PUT (no resumable-session round-trip), large
+    ones a chunked resumable upload that only retries the failed chunk, and
+    very large ones a parallel multipart upload. Large payloads are encoded
+    in pieces, so no full encoded copy of the content is held in memory.
+    
+    if_generation_match=0 only creates the object if it does not exist yet,
+    which makes the upload safe to retry (and enables the client's own
+    retries). Parallel multipart uploads do not support the precondition.
+    
+    Returns:
+        Size of the uploaded object in bytes
+    """
+    blob.content_type = _TEXT_CONTENT_TYPE
+    
+    if len(content) < _RESUMABLE_UPLOAD_THRESHOLD:
+        # The str is passed through; no separate encoded copy is kept here
+        blob.upload_from_string(
+            content,
+            content_type=_TEXT_CONTENT_TYPE,
+            if_generation_match=if_generation_match
+        )
+        if blob.size is not None:
+            return blob.size
+        return len(content.encode("utf-8"))
+    
+    if len(content) < _PARALLEL_UPLOAD_THRESHOLD:
+        blob.chunk_size = _UPLOAD_CHUNK_SIZE
+        # The blob writer buffers up to one chunk and uploads it inline once
+        # full; closing it sends the remainder and finalizes the upload
+        f = blob.open(
+            "wb",
+            chunk_size=_UPLOAD_CHUNK_SIZE,
+            ignore_flush=True,
+            content_type=_TEXT_CONTENT_TYPE,
+            if_generation_match=if_generation_match
+        )
+        try:
+            size = _write_utf8(f, content)
+        except BaseException:
+            # Never finalize a partial write: closing the blob writer (which
+            # IOBase.__del__ would also do) commits what was sent as the object
+            _abort_upload(f)
+            raise
+        f.close()
+        return size
+    
+    # Parallel uploads read from a file. Where /tmp is memory-backed (Cloud
+    # Run), the spooled copy doubles this path's footprint; point TMPDIR at
+    # disk-backed storage to avoid that. Threads, not the default process
+    # pool: forking this threaded process is unsafe, and chunk uploads are
+    # I/O-bound anyway.
+    with tempfile.NamedTemporaryFile() as tmp:
+        size = _write_utf8(tmp, content)
+        tmp.flush()
+        transfer_manager.upload_chunks_concurrently(
+            tmp.name,
+            blob,
+            chunk_size=_PARALLEL_UPLOAD_CHUNK_SIZE,
+            worker_type=transfer_manager.THREAD
+        )
+    return size
+
+
+def artifact_object_key(path: str) -> str:
+    """
+    Get the object name an artifact path is stored under.
+    
+    A short hash prefix spreads sequential (timestamp or job-id) paths across
+    the bucket's key range instead of concentrating them on one shard.
+    
+    Args:
+        path: Logical artifact path, as passed to artifacts_write_text
+    
+    Returns:
+        Object name within the artifact bucket
+    """
+    prefix = hashlib.blake2b(path.encode("utf-8"), digest_size=2).hexdigest()
+    return f"{prefix}/{path}"
+
+
+def artifacts_write_text(path: str, content: str, overwrite: bool = True) -> Dict[str, Any]:
     """
     Write a text artifact to Cloud Storage.
     
+    The object is stored under artifact_object_key(path); the logical path
+    is kept in the object's metadata.
+    
     Args:
-        path: Path within the bucket for the artifact
+        path: Logical path for the artifact
         content: Text content to write
+        overwrite: Replace an existing artifact; when False the write fails
+            if the artifact exists, and retried uploads are idempotent
     
     Returns:
         Dictionary with status and gs_uri
     """
     try:
-        client = storage.Client(project=os.environ.get("PROJECT_ID", "echovaeris"))
-        bucket_name = os.environ.get("GCS_BUCKET", f"orchestrator-{os.environ.get('PROJECT_ID', 'echovaeris')}-{os.environ.get('REGION', 'us-central1')}")
-        
-        # Remove gs:// prefix if present
-        if bucket_name.startswith("gs://"):
-            bucket_name = bucket_name[5:].rstrip("/")
-        
-        bucket = client.bucket(bucket_name)
-        blob = bucket.blob(path)
+        ts = datetime.now(timezone.utc).isoformat()
+        bucket_name = _bucket_name()
+        obj_key = artifact_object_key(path)
+        blob = _gcs_bucket(bucket_name).blob(obj_key)
         
         # Add metadata
         blob.metadata = {
             "created_by": "orchestrator-nova",
-            "timestamp": datetime.utcnow().isoformat(),
-            "content_type": "text/plain"
+            "timestamp": ts,
+            "content_type": "text/plain",
+            "logical_path": path
         }
         
         # Upload content
-        blob.upload_from_string(content.encode("utf-8"))
+        size_bytes = _do_upload(blob, content, if_generation_match=None if overwrite else 0)
         
-        gs_uri = f"gs://{bucket_name}/{path}"
-        logger.info("Artifact written", path=path, gs_uri=gs_uri, size=len(content))
+        gs_uri = f"gs://{bucket_name}/{obj_key}"
+        logger.info("Artifact written", path=path, gs_uri=gs_uri, size=size_bytes)
         
         return {
             "status": "success",
             "gs_uri": gs_uri,
-            "size_bytes": len(content),
-            "timestamp": datetime.utcnow().isoformat()
+            "path": path,
+            "size_bytes": size_bytes,
+            "timestamp": ts
         }
         
     except Exception as e:
@@ -136,6 +558,46 @@ def artifacts_write_text(path: str, content: str) -> Dict[str, Any]:
         raise
 
 
+# Simulated ETL processing time; 0 disables the placeholder delay
+ETL_SIMULATE_MS = int(os.getenv("ETL_SIMULATE_MS", "0"))
+
+
+def _etl_start(payload: Dict[str, Any]) -> Tuple[str, datetime, int]:
+    """Assign a job id and log the start of an ETL job."""
+    start_time = datetime.now(timezone.utc)
+    t0 = time.perf_counter_ns()
+    job_id = f"etl_{int(start_time.timestamp())}"
+    
+    logger.info("Starting ETL job", job_id=job_id, payload=payload)
+    
+    return job_id, start_time, t0
+
+
+def _etl_finish(job_id: str, payload: Dict[str, Any], start_time: datetime, t0: int) -> Dict[str, Any]:
+    """Build the result of a completed ETL job."""
+    # In production, this would:
+    # 1. Submit job to Cloud Run Jobs or Dataflow
+    # 2. Track job progress
+    # 3. Return job handle for monitoring
+    
+    elapsed_ns = time.perf_counter_ns() - t0
+    duration_ms = elapsed_ns // 1_000_000
+    end_time = start_time + timedelta(microseconds=elapsed_ns // 1_000)
+    
+    result = {
+        "status": "success",
+        "job_id": job_id,
+        "echo": payload,
+        "duration_ms": duration_ms,
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat()
+    }
+    
+    logger.info("ETL job completed", job_id=job_id, duration_ms=duration_ms)
+    
+    return result
+
+
 def etl_run_job(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Execute an ETL job (placeholder implementation).
@@ -147,44 +609,39 @@ def etl_run_job(payload: Dict[str, Any]) -> Dict[str, Any]:
         Dictionary with job execution results
     """
     try:
-        job_id = f"etl_{int(time.time())}"
-        start_time = datetime.utcnow()
-        
-        logger.info("Starting ETL job", job_id=job_id, payload=payload)
+        job_id, start_time, t0 = _etl_start(payload)
         
         # Simulate job execution
         # In production, this would trigger actual ETL pipeline
-        time.sleep(1)  # Simulate processing
-        
-        # Record job metadata
-        job_metadata = {
-            "job_id": job_id,
-            "job_type": "ETL",
-            "payload": payload,
-            "start_time": start_time.isoformat(),
-            "status": "running"
-        }
-        
-        # In production, this would:
-        # 1. Submit job to Cloud Run Jobs or Dataflow
-        # 2. Track job progress
-        # 3. Return job handle for monitoring
+        if ETL_SIMULATE_MS:
+            time.sleep(ETL_SIMULATE_MS / 1000)
         
-        end_time = datetime.utcnow()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        return _etl_finish(job_id, payload, start_time, t0)
         
-        result = {
-            "status": "success",
-            "job_id": job_id,
-            "echo": payload,
-            "duration_ms": duration_ms,
-            "start_time": start_time.isoformat(),
-            "end_time": end_time.isoformat()
-        }
+    except Exception as e:
+        logger.error("ETL job failed", payload=payload, error=str(e))
+        raise
+
+
+async def etl_run_job_async(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute an ETL job without blocking the event loop (placeholder implementation).
+    
+    Args:
+        payload: Job configuration and parameters
+    
+    Returns:
+        Dictionary with job execution results
+    """
+    try:
+        job_id, start_time, t0 = _etl_start(payload)
         
-        logger.info("ETL job completed", job_id=job_id, duration_ms=duration_ms)
+        # Simulate job execution
+        # In production, this would trigger actual ETL pipeline
+        if ETL_SIMULATE_MS:
+            await asyncio.sleep(ETL_SIMULATE_MS / 1000)
         
-        return result
+        return _etl_finish(job_id, payload, start_time, t0)
         
     except Exception as e:
         logger.error("ETL job failed", payload=payload, error=str(e))
@@ -203,7 +660,8 @@ def train_model(model_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
         Dictionary with training job details
     """
     try:
-        job_id = f"train_{model_name}_{int(time.time())}"
+        now = datetime.now(timezone.utc)
+        job_id = f"train_{model_name}_{int(now.timestamp())}"
         
         logger.info("Starting training job", job_id=job_id, model_name=model_name)
         
@@ -218,7 +676,7 @@ def train_model(model_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
             "model_name": model_name,
             "config": config,
             "estimated_duration_minutes": 30,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
         
     except Exception as e:
@@ -239,7 +697,8 @@ def deploy_agent(agent_name: str, version: str, config: Dict[str, Any]) -> Dict[
         Dictionary with deployment details
     """
     try:
-        deployment_id = f"deploy_{agent_name}_{version}_{int(time.time())}"
+        now = datetime.now(timezone.utc)
+        deployment_id = f"deploy_{agent_name}_{version}_{int(now.timestamp())}"
         
         logger.info("Deploying agent", deployment_id=deployment_id, agent_name=agent_name, version=version)
         
@@ -255,7 +714,7 @@ def deploy_agent(agent_name: str, version: str, config: Dict[str, Any]) -> Dict[
             "agent_name": agent_name,
             "version": version,
             "endpoint": f"https://{os.environ.get('REGION', 'us-central1')}-aiplatform.googleapis.com/v1/projects/{os.environ.get('PROJECT_ID', 'echovaeris')}/endpoints/{deployment_id}",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
         
     except Exception as e:
@@ -267,11 +726,15 @@ def deploy_agent(agent_name: str, version: str, config: Dict[str, Any]) -> Dict[
 TOOL_REGISTRY = {
     "runs_record_event": runs_record_event,
     "artifacts_write_text": artifacts_write_text,
-    "etl_run_job": etl_run_job,
+    "etl_run_job": etl_run_job_async,
     "train_model": train_model,
     "deploy_agent": deploy_agent,
 }
 
+# Sync tools that only build their result and never block; safe to call
+# inline on the event loop instead of in a worker thread
+NON_BLOCKING_TOOLS = frozenset({"train_model", "deploy_agent"})
+
 
 def get_tool(tool_name: str):
     """Get a tool function by name."""
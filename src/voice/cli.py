@@ -9,6 +9,11 @@ from pathlib import Path
 import click
 from rich.console import Console
 
+try:
+    import uvloop
+except ImportError:  # Optional: falls back to the default asyncio loop
+    uvloop = None
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -17,6 +22,13 @@ from src.voice.voice_orchestrator import VoiceOrchestrator
 console = Console()
 
 
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 @click.group()
 def cli():
     """Voice-enabled Orchestrator Nova CLI."""
@@ -39,7 +51,7 @@ def interactive():
     console.print("[yellow]Starting interactive session...[/yellow]\n")
     
     # Run interactive session
-    asyncio.run(orchestrator.start_voice_session())
+    run_async(orchestrator.start_voice_session())
 
 
 @cli.command()
@@ -55,8 +67,14 @@ def process(command: str):
     
     orchestrator = VoiceOrchestrator()
     
+    async def run_command():
+        try:
+            return await orchestrator.process_voice_command(command)
+        finally:
+            await orchestrator.flush_telemetry()
+    
     # Process command
-    result = asyncio.run(orchestrator.process_voice_command(command))
+    result = run_async(run_command())
     
     if result.get("status") == "success":
         console.print(f"[green]✓ Success[/green]")
@@ -80,8 +98,6 @@ def test():
     if sa_key_path.exists():
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(sa_key_path.absolute())
     
-    orchestrator = VoiceOrchestrator()
-    
     # Test commands
     test_commands = [
         "Check the orchestrator status",
@@ -89,17 +105,30 @@ def test():
         "Create an artifact with the message 'Voice test successful'"
     ]
     
+    orchestrator = VoiceOrchestrator()
+    
     async def run_tests():
-        for cmd in test_commands:
+        # The commands are independent, so each runs in its own chat session
+        # and they execute concurrently instead of taking turns
+        results = await asyncio.gather(
+            *(
+                orchestrator.process_voice_command(cmd, f"test-{i}")
+                for i, cmd in enumerate(test_commands)
+            ),
+            return_exceptions=True
+        )
+        await orchestrator.flush_telemetry()
+        for cmd, result in zip(test_commands, results):
             console.print(f"[yellow]Testing:[/yellow] {cmd}")
-            result = await orchestrator.process_voice_command(cmd)
-            if result.get("status") == "success":
+            if isinstance(result, BaseException):
+                console.print(f"  [red]✗ Failed: {result}[/red]")
+            elif result.get("status") == "success":
                 console.print(f"  [green]✓ Passed[/green]")
             else:
                 console.print(f"  [red]✗ Failed: {result.get('error')}[/red]")
             console.print("")
     
-    asyncio.run(run_tests())
+    run_async(run_tests())
     console.print("[green]Voice function tests completed![/green]")
 
 
@@ -1,18 +1,63 @@
 """Gemini Live API integration for voice interactions."""
 
 import os
-import json
+import time
 import asyncio
-import logging
-from typing import Dict, Any, Optional, Callable, List
+import inspect
+from collections import OrderedDict, deque
+from collections.abc import Mapping, Sequence
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from datetime import datetime
 
 import google.generativeai as genai
 from google.generativeai.types import FunctionDeclaration, Tool
+import msgspec
 import structlog
 
+from ..orchestrator.log import info_enabled
+
 logger = structlog.get_logger(__name__)
 
+# Most recent conversation turns kept per handler
+VOICE_HISTORY_MAX = int(os.getenv("VOICE_HISTORY_MAX", "200"))
+# Distinct commands whose function calls are remembered per chat session
+VOICE_INTENT_CACHE_SIZE = int(os.getenv("VOICE_INTENT_CACHE_SIZE", "32"))
+# Chat sessions kept per handler; the least recently used is dropped first
+VOICE_SESSION_CACHE_SIZE = int(os.getenv("VOICE_SESSION_CACHE_SIZE", "1024"))
+# Conversation turns a chat session keeps; each turn re-sends the whole history
+VOICE_CHAT_HISTORY_TURNS = max(1, int(os.getenv("VOICE_CHAT_HISTORY_TURNS", "20")))
+
+
+# Functions without side effects; only commands calling nothing else are
+# replayed from the intent cache, since a replay bypasses Gemini and the chat
+REPLAYABLE_FUNCTIONS = frozenset({"check_status"})
+
+
+def _builtin_hook(obj: Any) -> Any:
+    """Convert values msgspec has no builtin form for (e.g. proto maps from call args)."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Sequence):
+        return list(obj)
+    return str(obj)
+
+
+def _to_builtins(result: Any) -> Any:
+    """Convert a function result (dict or msgspec Struct) to JSON-compatible builtins."""
+    return msgspec.to_builtins(result, enc_hook=_builtin_hook)
+
+
+class _ChatSession:
+    """A Gemini chat session, the lock that keeps its turns in order, and its intent cache."""
+    
+    __slots__ = ("chat", "lock", "intents")
+    
+    def __init__(self, chat):
+        self.chat = chat
+        self.lock = asyncio.Lock()
+        # Normalized transcript -> replayable function calls Gemini chose for it
+        self.intents: "OrderedDict[str, Tuple[Tuple[str, Dict[str, Any]], ...]]" = OrderedDict()
+
 
 class GeminiLiveHandler:
     """Handler for Gemini Live API voice interactions."""
@@ -27,14 +72,31 @@ class GeminiLiveHandler:
             genai.configure(api_key=self.api_key)
         
         self.model = None
+        # Chat sessions by session_id, least recently used first
+        self._sessions: "OrderedDict[str, _ChatSession]" = OrderedDict()
         self.tools = []
+        self._tool_obj: Optional[Tool] = None
         self.function_handlers = {}
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=VOICE_HISTORY_MAX)
+        # Receivers of progress chunks sent by functions while they run
+        self._partial_listeners: List[Callable[[Dict[str, Any]], Any]] = []
+        
+    def register_function(
+        self,
+        name: str,
+        handler: Callable,
+        description: str,
+        parameters: Dict[str, Any],
+        declaration: Optional[FunctionDeclaration] = None
+    ):
+        """
+        Register a function that can be called from voice commands.
         
-    def register_function(self, name: str, handler: Callable, description: str, parameters: Dict[str, Any]):
-        """Register a function that can be called from voice commands."""
+        A prebuilt ``declaration`` for the same name, description and
+        parameters can be passed to skip converting the schema again.
+        """
         # Create function declaration for Gemini
-        func_declaration = FunctionDeclaration(
+        func_declaration = declaration or FunctionDeclaration(
             name=name,
             description=description,
             parameters=parameters
@@ -42,68 +104,111 @@ class GeminiLiveHandler:
         
         self.tools.append(func_declaration)
         self.function_handlers[name] = handler
+        self._tool_obj = None
+        for session in self._sessions.values():
+            session.intents.clear()
         
         logger.info("Function registered", name=name, description=description)
     
     def initialize_model(self, model_name: str = "gemini-1.5-flash"):
         """Initialize the Gemini model with tools."""
-        # Create Tool object with all registered functions
-        if self.tools:
-            tool = Tool(function_declarations=self.tools)
+        # Create Tool object with all registered functions, reused until
+        # another function is registered
+        if self._tool_obj is None and self.tools:
+            self._tool_obj = Tool(function_declarations=self.tools)
+        
+        if self._tool_obj is not None:
             self.model = genai.GenerativeModel(
                 model_name=model_name,
-                tools=[tool]
+                tools=[self._tool_obj]
             )
         else:
             self.model = genai.GenerativeModel(model_name=model_name)
         
+        # Sessions started on a previous model would not see the new tools
+        self._sessions.clear()
+        
         logger.info("Model initialized", model=model_name, tools_count=len(self.tools))
     
-    async def process_voice_command(self, transcript: str) -> Dict[str, Any]:
-        """Process a voice command and execute functions if needed."""
+    def _session(self, session_id: Optional[str]) -> _ChatSession:
+        """
+        Get the chat session for ``session_id``, starting one on a miss.
+        
+        Without a session_id the command gets a one-off session, so callers
+        that do not identify themselves never share conversation context.
+        """
+        if session_id is None:
+            return _ChatSession(self.model.start_chat(enable_automatic_function_calling=False))
+        
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = _ChatSession(self.model.start_chat(enable_automatic_function_calling=False))
+            self._sessions[session_id] = session
+            if len(self._sessions) > VOICE_SESSION_CACHE_SIZE:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        return session
+    
+    async def process_voice_command(self, transcript: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Process a voice command in a chat session and execute functions if needed."""
         if not self.model:
             self.initialize_model()
         
         # Add to conversation history
         self.conversation_history.append({
             "role": "user",
-            "parts": [transcript],
-            "timestamp": datetime.utcnow().isoformat()
+            "text": transcript,
+            "ts": int(time.time())
         })
         
+        session = self._session(session_id)
+        
+        # Read-only commands this session has sent before go straight to the
+        # functions Gemini chose last time
+        key = transcript.strip().lower()
+        calls = session.intents.get(key)
+        if calls is not None:
+            session.intents.move_to_end(key)
+            return await self._replay_intent(transcript, calls)
+        
+        # A turn (message, function calls, function responses) must complete
+        # before the session's next turn is sent; other sessions run meanwhile
+        async with session.lock:
+            return await self._chat_turn(session, transcript, key)
+    
+    async def _chat_turn(self, session: _ChatSession, transcript: str, key: str) -> Dict[str, Any]:
+        """Run one conversation turn on a chat session."""
+        chat = session.chat
         try:
-            # Generate response with function calling
-            response = self.model.generate_content(transcript)
+            # Send the turn on the chat session; earlier turns stay in its context
+            response = await chat.send_message_async(transcript)
             
-            # Check if function was called
-            if hasattr(response, 'candidates') and response.candidates:
-                candidate = response.candidates[0]
+            # Check if functions were called
+            function_calls = self._function_calls(response)
+            if function_calls:
+                calls = tuple((fc.name, _to_builtins(fc.args)) for fc in function_calls)
+                results = await self._run_function_calls(calls)
+                
+                if all(name in REPLAYABLE_FUNCTIONS for name, _ in calls) and not any(
+                    "error" in result["result"] for result in results
+                ):
+                    self._remember_intent(session, key, calls)
                 
-                if hasattr(candidate, 'function_calls') and candidate.function_calls:
-                    # Execute function calls
-                    results = []
-                    for func_call in candidate.function_calls:
-                        result = await self._execute_function(
-                            func_call.name,
-                            func_call.args
-                        )
-                        results.append({
-                            "function": func_call.name,
-                            "result": result
-                        })
-                    
-                    # Generate final response with function results
-                    final_response = self._generate_response_with_results(transcript, results)
-                    
-                    return {
-                        "status": "success",
-                        "transcript": transcript,
-                        "function_calls": results,
-                        "response": final_response,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
+                # Answer the function calls in the same session for the final response
+                final_response = await self._respond_with_results(chat, results)
+                self._trim_history(chat)
+                
+                return {
+                    "status": "success",
+                    "transcript": transcript,
+                    "function_calls": results,
+                    "response": final_response,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
             
             # Regular response without function calling
+            self._trim_history(chat)
             return {
                 "status": "success",
                 "transcript": transcript,
@@ -112,7 +217,7 @@ class GeminiLiveHandler:
             }
             
         except Exception as e:
-            logger.error("Voice command processing failed", error=str(e), transcript=transcript)
+            logger.exception("Voice command processing failed", transcript=transcript)
             return {
                 "status": "error",
                 "transcript": transcript,
@@ -120,6 +225,75 @@ class GeminiLiveHandler:
                 "timestamp": datetime.utcnow().isoformat()
             }
     
+    @staticmethod
+    def _trim_history(chat):
+        """
+        Drop a chat session's oldest turns beyond VOICE_CHAT_HISTORY_TURNS.
+        
+        Turns are cut where a user message starts, so a turn's function calls
+        and function responses are always kept or dropped together.
+        """
+        history = chat.history
+        starts = [
+            i for i, content in enumerate(history)
+            if content.role == "user" and any(part.text for part in content.parts)
+        ]
+        if len(starts) > VOICE_CHAT_HISTORY_TURNS:
+            chat.history = history[starts[-VOICE_CHAT_HISTORY_TURNS]:]
+    
+    async def _replay_intent(
+        self,
+        transcript: str,
+        calls: Tuple[Tuple[str, Dict[str, Any]], ...]
+    ) -> Dict[str, Any]:
+        """Answer a cached command by running its function calls without Gemini."""
+        results = await self._run_function_calls(calls)
+        messages = [
+            result["result"].get("message") for result in results
+            if isinstance(result["result"], dict)
+        ]
+        
+        return {
+            "status": "success",
+            "transcript": transcript,
+            "function_calls": results,
+            "response": " ".join(m for m in messages if m) or "Done.",
+            "cached": True,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    @staticmethod
+    def _remember_intent(session: _ChatSession, key: str, calls: Tuple[Tuple[str, Dict[str, Any]], ...]):
+        """Cache a session's function calls for a command, evicting the least recently used."""
+        session.intents[key] = calls
+        session.intents.move_to_end(key)
+        if len(session.intents) > VOICE_INTENT_CACHE_SIZE:
+            session.intents.popitem(last=False)
+    
+    async def _run_function_calls(self, calls: Tuple[Tuple[str, Dict[str, Any]], ...]) -> List[Dict[str, Any]]:
+        """Execute (name, args) function calls concurrently; they are independent."""
+        raw = await asyncio.gather(
+            *(self._execute_function(name, args) for name, args in calls),
+            return_exceptions=True
+        )
+        return [
+            {
+                "function": name,
+                "result": {"error": str(result)} if isinstance(result, BaseException) else _to_builtins(result)
+            }
+            for (name, _), result in zip(calls, raw)
+        ]
+    
+    @staticmethod
+    def _function_calls(response) -> List[Any]:
+        """Extract the function calls from a model response."""
+        if not response.candidates:
+            return []
+        return [
+            part.function_call for part in response.candidates[0].content.parts
+            if part.function_call.name
+        ]
+    
     async def _execute_function(self, function_name: str, args: Dict[str, Any]) -> Any:
         """Execute a registered function."""
         if function_name not in self.function_handlers:
@@ -135,37 +309,70 @@ class GeminiLiveHandler:
             else:
                 result = await asyncio.to_thread(handler, **args)
             
-            logger.info("Function executed", function=function_name, result=result)
+            # Log the result size rather than the result, and only when INFO is on
+            if info_enabled():
+                logger.info(
+                    "Function executed",
+                    function=function_name,
+                    result_size=len(msgspec.json.encode(result, enc_hook=_builtin_hook))
+                )
             return result
             
         except Exception as e:
-            logger.error("Function execution failed", function=function_name, error=str(e))
+            logger.exception("Function execution failed", function=function_name)
             return {"error": str(e)}
     
-    def _generate_response_with_results(self, original_request: str, results: List[Dict[str, Any]]) -> str:
-        """Generate a natural language response based on function results."""
-        # Format results for context
-        context = f"User request: {original_request}\n\nFunction results:\n"
-        for result in results:
-            context += f"- {result['function']}: {json.dumps(result['result'], indent=2)}\n"
-        
-        # Generate response
-        prompt = f"{context}\n\nGenerate a natural, conversational response based on these results:"
+    async def _respond_with_results(self, chat, results: List[Dict[str, Any]]) -> str:
+        """Send function results back to the chat session and return its reply."""
+        parts = [
+            genai.protos.Part(function_response=genai.protos.FunctionResponse(
+                name=result["function"],
+                response={"result": result["result"]}
+            ))
+            for result in results
+        ]
         
         try:
-            response = self.model.generate_content(prompt)
+            response = await chat.send_message_async(parts)
             return response.text
-        except Exception as e:
-            logger.error("Failed to generate response", error=str(e))
+        except Exception:
+            logger.exception("Failed to generate response")
+            # Drop the unanswered function-call turn so the session stays usable
+            chat.rewind()
             return f"I've completed the requested actions. {len(results)} functions were executed successfully."
     
+    def add_partial_listener(self, listener: Callable[[Dict[str, Any]], Any]):
+        """Register a sync or async callable to receive partial results via stream_partial()."""
+        if listener not in self._partial_listeners:
+            self._partial_listeners.append(listener)
+    
+    async def stream_partial(self, chunk: Dict[str, Any]):
+        """
+        Deliver a progress chunk from a running function to the listeners.
+        
+        Gemini only sees a function's final result, so partials go to the
+        session directly and let it report progress before the reply arrives.
+        Listener failures are logged and never interrupt the function.
+        """
+        for listener in self._partial_listeners:
+            try:
+                outcome = listener(chunk)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception:
+                logger.exception("Partial result listener failed")
+    
     def get_conversation_history(self) -> List[Dict[str, Any]]:
-        """Get the conversation history."""
-        return self.conversation_history
+        """Get the conversation history, oldest turn first."""
+        return list(self.conversation_history)
     
-    def clear_history(self):
-        """Clear conversation history."""
-        self.conversation_history = []
+    def clear_history(self, session_id: Optional[str] = None):
+        """Clear conversation history and end one chat session, or all of them."""
+        self.conversation_history.clear()
+        if session_id is None:
+            self._sessions.clear()
+        else:
+            self._sessions.pop(session_id, None)
         logger.info("Conversation history cleared")
 
 
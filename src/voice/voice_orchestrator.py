@@ -1,335 +1,537 @@
 """Voice-enabled orchestrator that integrates Gemini Live with Orchestrator Nova."""
 
+import io
+import os
+import sys
+import time
 import asyncio
-import json
-from typing import Dict, Any, Optional
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Awaitable, Callable, Hashable, Optional, Tuple
 
+import msgspec
+import orjson
 import structlog
-from ..orchestrator import Orchestrator, runs_record_event, artifacts_write_text, etl_run_job
+from ..orchestrator import Orchestrator, EventBatcher, artifacts_write_text, etl_run_job_async
+from ..orchestrator.log import info_enabled
+from ..orchestrator.tools import train_model
+from google.generativeai.types import FunctionDeclaration
 from .gemini_live import GeminiLiveHandler
 
 logger = structlog.get_logger(__name__)
 
+# Worker threads for blocking tool calls made by voice functions
+VOICE_IO_WORKERS = int(os.getenv("VOICE_IO_WORKERS", "8"))
+# Longest a voice-triggered ETL job may run before the command gives up on it
+VOICE_ETL_TIMEOUT_S = float(os.getenv("VOICE_ETL_TIMEOUT_S", "30"))
+
+
+# Gemini function schemas; static, so built once and shared by all instances
+_EXECUTE_TASK_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "goal": {
+            "type": "string",
+            "description": "The goal or task to execute"
+        },
+        "verbose": {
+            "type": "boolean",
+            "description": "Whether to provide detailed output"
+        }
+    },
+    "required": ["goal"]
+})
+
+_CHECK_STATUS_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "limit": {
+            "type": "integer",
+            "description": "Number of recent tasks to show"
+        }
+    }
+})
+
+_RUN_ETL_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "pipeline_name": {
+            "type": "string",
+            "description": "Name of the ETL pipeline to run"
+        },
+        "parameters": {
+            "type": "object",
+            "description": "Parameters for the ETL job"
+        }
+    },
+    "required": ["pipeline_name"]
+})
+
+_CREATE_ARTIFACT_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "Name for the artifact"
+        },
+        "content": {
+            "type": "string",
+            "description": "Content of the artifact"
+        },
+        "path": {
+            "type": "string",
+            "description": "Storage path for the artifact"
+        }
+    },
+    "required": ["name", "content"]
+})
+
+_START_TRAINING_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "model_name": {
+            "type": "string",
+            "description": "Name of the model to train"
+        },
+        "config": {
+            "type": "object",
+            "description": "Training configuration",
+            "properties": {
+                "epochs": {
+                    "type": "integer",
+                    "description": "Number of training epochs"
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Training batch size"
+                }
+            }
+        }
+    },
+    "required": ["model_name"]
+})
+
+# (name, handler method, description, parameters) for each voice function
+_FUNCTION_SPECS = (
+    ("execute_task", "execute_task", "Execute an orchestration task with a specific goal", _EXECUTE_TASK_SCHEMA),
+    ("check_status", "check_status", "Check the status of the orchestrator and recent tasks", _CHECK_STATUS_SCHEMA),
+    ("run_etl", "run_etl", "Run an ETL pipeline job", _RUN_ETL_SCHEMA),
+    ("create_artifact", "create_artifact", "Create and store an artifact", _CREATE_ARTIFACT_SCHEMA),
+    ("start_training", "start_training", "Start a model training job", _START_TRAINING_SCHEMA),
+)
+
+
+@lru_cache(maxsize=1)
+def _function_declarations() -> Tuple[FunctionDeclaration, ...]:
+    """Gemini declarations for _FUNCTION_SPECS, converted from the schemas once per process."""
+    return tuple(
+        FunctionDeclaration(name=name, description=description, parameters=parameters)
+        for name, _, description, parameters in _FUNCTION_SPECS
+    )
+
+
+# Interactive session text
+_HELP_BANNER = (
+    "\n🎤 Voice Orchestrator Active\n"
+    "Say commands like:\n"
+    "  - 'Execute task to process ETL pipeline'\n"
+    "  - 'Check orchestrator status'\n"
+    "  - 'Run ETL pipeline for customer data'\n"
+    "  - 'Create an artifact with today's report'\n"
+    "  - 'Start training the recommendation model'\n"
+    "\nType 'exit' to quit\n\n"
+)
+_PROMPT = "🎤 Voice command (or type): "
+# Chat session that keeps context across the interactive session's commands
+_INTERACTIVE_SESSION = "interactive"
+
+
+# Voice function results; converted to builtins once, where they go back to Gemini
+class TaskResult(msgspec.Struct, omit_defaults=True):
+    """Result of the execute_task voice function."""
+    status: str
+    goal: str
+    message: str
+    steps_completed: Optional[int] = None
+    plan: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class StatusResult(msgspec.Struct, omit_defaults=True):
+    """Result of the check_status voice function."""
+    status: str
+    message: str
+    orchestrator_status: Optional[str] = None
+    execution_summary: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class EtlResult(msgspec.Struct, omit_defaults=True):
+    """Result of the run_etl voice function."""
+    status: str
+    pipeline: str
+    message: str
+    job_id: Optional[str] = None
+    duration_ms: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ArtifactResult(msgspec.Struct, omit_defaults=True):
+    """Result of the create_artifact voice function."""
+    status: str
+    artifact_name: str
+    message: str
+    gs_uri: Optional[str] = None
+    size_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+
+class TrainingResult(msgspec.Struct, omit_defaults=True):
+    """Result of the start_training voice function."""
+    status: str
+    model_name: str
+    message: str
+    job_id: Optional[str] = None
+    config: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def _print_partial(chunk: Dict[str, Any]):
+    """Print a step progress chunk during an interactive session."""
+    sys.stdout.write(f"  … step {chunk['step'] + 1}: {chunk['tool']} ({chunk.get('status') or 'done'})\n")
+    sys.stdout.flush()
+
+
+async def _ainput(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    The read runs on a daemon thread rather than a pool worker, so a read that
+    is still pending when the session is interrupted cannot hold up exit. It
+    goes through an unbuffered view of the stdin descriptor instead of
+    input(): a daemon thread parked inside sys.stdin's buffered reader holds
+    its lock and aborts interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def read():
+        try:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            with io.FileIO(sys.stdin.fileno(), "rb", closefd=False) as stdin:
+                raw = stdin.readline()
+            if not raw:
+                raise EOFError
+            line = raw.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r\n")
+            callback = (future.set_result, line)
+        except BaseException as e:
+            callback = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(resolve, *callback)
+        except RuntimeError:
+            # The loop closed while waiting for input
+            pass
+    
+    threading.Thread(target=read, name="voice-stdin", daemon=True).start()
+    return await future
+
 
 class VoiceOrchestrator:
     """Voice-enabled orchestrator combining Gemini Live and Orchestrator Nova."""
     
     def __init__(self):
         """Initialize voice orchestrator."""
-        self.orchestrator = Orchestrator()
+        # Telemetry is coalesced into small batches, each written with one COPY
+        self.events = EventBatcher(max_batch=32, max_delay=0.02)
+        self.orchestrator = Orchestrator(events=self.events)
         self.voice_handler = GeminiLiveHandler()
-        self.setup_voice_functions()
-        
-    def setup_voice_functions(self):
-        """Register orchestrator functions for voice control."""
-        
-        # Register task execution
-        self.voice_handler.register_function(
-            name="execute_task",
-            handler=self.execute_task,
-            description="Execute an orchestration task with a specific goal",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "goal": {
-                        "type": "string",
-                        "description": "The goal or task to execute"
-                    },
-                    "verbose": {
-                        "type": "boolean",
-                        "description": "Whether to provide detailed output"
-                    }
-                },
-                "required": ["goal"]
-            }
-        )
+        self._pool = ThreadPoolExecutor(max_workers=VOICE_IO_WORKERS, thread_name_prefix="voice-io")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Identical requests already running, shared by concurrent callers
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
         
-        # Register status check
-        self.voice_handler.register_function(
-            name="check_status",
-            handler=self.check_status,
-            description="Check the status of the orchestrator and recent tasks",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of recent tasks to show"
-                    }
-                }
-            }
-        )
+        # Per-handler loggers with their static context bound once
+        self._log_exec = logger.bind(handler="execute_task")
+        self._log_status = logger.bind(handler="check_status")
+        self._log_etl = logger.bind(handler="run_etl")
+        self._log_artifact = logger.bind(handler="create_artifact")
+        self._log_training = logger.bind(handler="start_training")
+        self._log_command = logger.bind(handler="process_voice_command")
         
-        # Register ETL job execution
-        self.voice_handler.register_function(
-            name="run_etl",
-            handler=self.run_etl,
-            description="Run an ETL pipeline job",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "pipeline_name": {
-                        "type": "string",
-                        "description": "Name of the ETL pipeline to run"
-                    },
-                    "parameters": {
-                        "type": "object",
-                        "description": "Parameters for the ETL job"
-                    }
-                },
-                "required": ["pipeline_name"]
-            }
-        )
+        self.setup_voice_functions()
+    
+    def close(self):
+        """Release the worker threads used for blocking tool calls."""
+        self._pool.shutdown(wait=False)
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop this orchestrator runs on, resolved once per loop."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+    
+    def _record_event(self, event_type: str, details: Dict[str, Any]):
+        """Queue a run event for the background batch writer, off the command's latency path."""
+        self.orchestrator.record_event(event_type, details)
+    
+    async def flush_telemetry(self):
+        """Write all queued telemetry and stop the batch writer until the next event."""
+        await self.events.stop()
+    
+    async def _coalesced(self, key: Hashable, run: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``run()`` once for all concurrent callers with the same key.
         
-        # Register artifact creation
-        self.voice_handler.register_function(
-            name="create_artifact",
-            handler=self.create_artifact,
-            description="Create and store an artifact",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name for the artifact"
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Content of the artifact"
-                    },
-                    "path": {
-                        "type": "string",
-                        "description": "Storage path for the artifact"
-                    }
-                },
-                "required": ["name", "content"]
-            }
-        )
+        The first caller starts the work as a task; callers arriving while it
+        is in flight await the same task. Each caller awaits through shield()
+        so one caller being cancelled does not cancel the others' result.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = task
+            
+            def forget(done: asyncio.Task):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+            
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
         
-        # Register training job
-        self.voice_handler.register_function(
-            name="start_training",
-            handler=self.start_training,
-            description="Start a model training job",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "model_name": {
-                        "type": "string",
-                        "description": "Name of the model to train"
-                    },
-                    "config": {
-                        "type": "object",
-                        "description": "Training configuration",
-                        "properties": {
-                            "epochs": {
-                                "type": "integer",
-                                "description": "Number of training epochs"
-                            },
-                            "batch_size": {
-                                "type": "integer",
-                                "description": "Training batch size"
-                            }
-                        }
-                    }
-                },
-                "required": ["model_name"]
-            }
-        )
+    def setup_voice_functions(self):
+        """Register orchestrator functions for voice control."""
+        for (name, handler, description, parameters), declaration in zip(
+            _FUNCTION_SPECS, _function_declarations()
+        ):
+            self.voice_handler.register_function(
+                name=name,
+                handler=getattr(self, handler),
+                description=description,
+                parameters=parameters,
+                declaration=declaration
+            )
         
         # Initialize model with functions
         self.voice_handler.initialize_model()
-        logger.info("Voice functions registered", count=5)
+        logger.info("Voice functions registered", count=len(_FUNCTION_SPECS))
+    
+    async def execute_task(self, goal: str, verbose: bool = False) -> TaskResult:
+        """Execute an orchestration task, sharing the run with identical concurrent requests."""
+        return await self._coalesced(
+            ("execute_task", goal, verbose),
+            lambda: self._execute_task(goal, verbose)
+        )
     
-    async def execute_task(self, goal: str, verbose: bool = False) -> Dict[str, Any]:
-        """Execute an orchestration task."""
+    async def _execute_task(self, goal: str, verbose: bool) -> TaskResult:
+        """Plan and run a task."""
         try:
-            # Record voice command
-            await asyncio.to_thread(
-                runs_record_event,
-                "VOICE_COMMAND",
-                {"goal": goal, "source": "gemini_live"}
-            )
-            
-            # Plan the task
-            plan = await self.orchestrator.plan(goal)
-            
-            # Execute the plan
-            results = await self.orchestrator.act(plan)
-            
-            # Record completion
-            await asyncio.to_thread(
-                runs_record_event,
-                "VOICE_COMPLETE",
-                {
+            async def report_step(index: int, tool: str, result: Dict[str, Any]):
+                await self.voice_handler.stream_partial({
+                    "partial": True,
+                    "function": "execute_task",
                     "goal": goal,
-                    "steps_completed": len(results),
-                    "status": "success"
-                }
+                    "step": index,
+                    "tool": tool,
+                    "status": result.get("status")
+                })
+            
+            plan, results = await self.orchestrator.execute_with_telemetry(
+                goal,
+                source="gemini_live",
+                start_event="VOICE_COMMAND",
+                complete_event="VOICE_COMPLETE",
+                error_event="VOICE_ERROR",
+                on_step=report_step,
+                # The full plan is only returned, and so only built, when verbose
+                materialize=verbose
             )
             
-            return {
-                "status": "success",
-                "goal": goal,
-                "steps_completed": len(results),
-                "plan": plan if verbose else None,
-                "message": f"Successfully executed task: {goal}"
-            }
+            return TaskResult(
+                status="success",
+                goal=goal,
+                steps_completed=len(results),
+                plan=self.orchestrator.plan_json(plan) if verbose else None,
+                message=f"Successfully executed task: {goal}"
+            )
             
         except Exception as e:
-            logger.error("Task execution failed", goal=goal, error=str(e))
-            return {
-                "status": "error",
-                "goal": goal,
-                "error": str(e),
-                "message": f"Failed to execute task: {str(e)}"
-            }
+            self._log_exec.exception("Task execution failed", goal=goal)
+            error = str(e)
+            return TaskResult(
+                status="error",
+                goal=goal,
+                error=error,
+                message=f"Failed to execute task: {error}"
+            )
     
-    async def check_status(self, limit: int = 5) -> Dict[str, Any]:
+    async def check_status(self, limit: int = 5) -> StatusResult:
         """Check orchestrator status and recent tasks."""
         try:
             summary = self.orchestrator.get_execution_summary()
             
-            return {
-                "status": "success",
-                "orchestrator_status": "operational",
-                "execution_summary": summary,
-                "message": f"Orchestrator is operational. {summary.get('total_executions', 0)} tasks executed."
-            }
+            return StatusResult(
+                status="success",
+                orchestrator_status="operational",
+                execution_summary=summary,
+                message=f"Orchestrator is operational. {summary.get('total_executions', 0)} tasks executed."
+            )
             
         except Exception as e:
-            logger.error("Status check failed", error=str(e))
-            return {
-                "status": "error",
-                "error": str(e),
-                "message": "Failed to check status"
-            }
+            self._log_status.exception("Status check failed")
+            error = str(e)
+            return StatusResult(
+                status="error",
+                error=error,
+                message="Failed to check status"
+            )
     
-    async def run_etl(self, pipeline_name: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Run an ETL pipeline."""
+    async def run_etl(self, pipeline_name: str, parameters: Dict[str, Any] = None) -> EtlResult:
+        """Run an ETL pipeline, sharing the run with identical concurrent requests."""
+        return await self._coalesced(
+            ("run_etl", pipeline_name, orjson.dumps(parameters or {}, option=orjson.OPT_SORT_KEYS, default=str)),
+            lambda: self._run_etl(pipeline_name, parameters)
+        )
+    
+    async def _run_etl(self, pipeline_name: str, parameters: Optional[Dict[str, Any]]) -> EtlResult:
+        """Record and run an ETL job."""
         try:
             # Record ETL request
-            await asyncio.to_thread(
-                runs_record_event,
+            self._record_event(
                 "ETL_START",
                 {"pipeline": pipeline_name, "parameters": parameters}
             )
             
-            # Execute ETL job
-            result = await asyncio.to_thread(
-                etl_run_job,
-                {
-                    "pipeline": pipeline_name,
-                    "parameters": parameters or {},
-                    "triggered_by": "voice_command"
-                }
+            # Execute ETL job; a stalled job is cancelled rather than holding the session
+            result = await asyncio.wait_for(
+                etl_run_job_async(
+                    {
+                        "pipeline": pipeline_name,
+                        "parameters": parameters or {},
+                        "triggered_by": "voice_command"
+                    }
+                ),
+                timeout=VOICE_ETL_TIMEOUT_S
             )
             
-            return {
-                "status": "success",
-                "pipeline": pipeline_name,
-                "job_id": result.get("job_id"),
-                "duration_ms": result.get("duration_ms"),
-                "message": f"ETL pipeline '{pipeline_name}' executed successfully"
-            }
+            return EtlResult(
+                status="success",
+                pipeline=pipeline_name,
+                job_id=result.get("job_id"),
+                duration_ms=result.get("duration_ms"),
+                message=f"ETL pipeline '{pipeline_name}' executed successfully"
+            )
             
+        except asyncio.TimeoutError:
+            self._log_etl.warning("ETL execution timed out", pipeline=pipeline_name, timeout_s=VOICE_ETL_TIMEOUT_S)
+            return EtlResult(
+                status="timeout",
+                pipeline=pipeline_name,
+                error=f"ETL job exceeded {VOICE_ETL_TIMEOUT_S:g}s",
+                message=f"ETL pipeline '{pipeline_name}' timed out after {VOICE_ETL_TIMEOUT_S:g} seconds"
+            )
         except Exception as e:
-            logger.error("ETL execution failed", pipeline=pipeline_name, error=str(e))
-            return {
-                "status": "error",
-                "pipeline": pipeline_name,
-                "error": str(e),
-                "message": f"Failed to run ETL pipeline: {str(e)}"
-            }
+            self._log_etl.exception("ETL execution failed", pipeline=pipeline_name)
+            error = str(e)
+            return EtlResult(
+                status="error",
+                pipeline=pipeline_name,
+                error=error,
+                message=f"Failed to run ETL pipeline: {error}"
+            )
     
-    async def create_artifact(self, name: str, content: str, path: str = "artifacts/") -> Dict[str, Any]:
+    async def create_artifact(self, name: str, content: str, path: str = "artifacts/") -> ArtifactResult:
         """Create and store an artifact."""
         try:
             # Generate full path
-            timestamp = int(datetime.utcnow().timestamp())
+            timestamp = time.time_ns() // 1_000_000_000
             full_path = f"{path}{name}_{timestamp}.txt"
             
             # Write artifact
-            result = await asyncio.to_thread(
+            result = await self._get_loop().run_in_executor(
+                self._pool,
                 artifacts_write_text,
                 full_path,
                 content
             )
             
-            return {
-                "status": "success",
-                "artifact_name": name,
-                "gs_uri": result.get("gs_uri"),
-                "size_bytes": result.get("size_bytes"),
-                "message": f"Artifact '{name}' created successfully"
-            }
+            return ArtifactResult(
+                status="success",
+                artifact_name=name,
+                gs_uri=result.get("gs_uri"),
+                size_bytes=result.get("size_bytes"),
+                message=f"Artifact '{name}' created successfully"
+            )
             
         except Exception as e:
-            logger.error("Artifact creation failed", name=name, error=str(e))
-            return {
-                "status": "error",
-                "artifact_name": name,
-                "error": str(e),
-                "message": f"Failed to create artifact: {str(e)}"
-            }
+            self._log_artifact.exception("Artifact creation failed", name=name)
+            error = str(e)
+            return ArtifactResult(
+                status="error",
+                artifact_name=name,
+                error=error,
+                message=f"Failed to create artifact: {error}"
+            )
     
-    async def start_training(self, model_name: str, config: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def start_training(self, model_name: str, config: Dict[str, Any] = None) -> TrainingResult:
         """Start a model training job."""
         try:
-            from ..orchestrator.tools import train_model
-            
             # Set default config
             if config is None:
                 config = {"epochs": 10, "batch_size": 32}
             
             # Record training request
-            await asyncio.to_thread(
-                runs_record_event,
+            self._record_event(
                 "TRAINING_START",
                 {"model": model_name, "config": config, "source": "voice_command"}
             )
             
-            # Start training
-            result = await asyncio.to_thread(
-                train_model,
-                model_name,
-                config
-            )
+            # Start training (only submits the job, so no thread hop)
+            result = train_model(model_name, config)
             
-            return {
-                "status": "success",
-                "model_name": model_name,
-                "job_id": result.get("job_id"),
-                "config": config,
-                "message": f"Training job for '{model_name}' started successfully"
-            }
+            return TrainingResult(
+                status="success",
+                model_name=model_name,
+                job_id=result.get("job_id"),
+                config=config,
+                message=f"Training job for '{model_name}' started successfully"
+            )
             
         except Exception as e:
-            logger.error("Training start failed", model=model_name, error=str(e))
-            return {
-                "status": "error",
-                "model_name": model_name,
-                "error": str(e),
-                "message": f"Failed to start training: {str(e)}"
-            }
+            self._log_training.exception("Training start failed", model=model_name)
+            error = str(e)
+            return TrainingResult(
+                status="error",
+                model_name=model_name,
+                error=error,
+                message=f"Failed to start training: {error}"
+            )
     
-    async def process_voice_command(self, transcript: str) -> Dict[str, Any]:
-        """Process a voice command through the orchestrator."""
-        logger.info("Processing voice command", transcript=transcript)
+    async def process_voice_command(self, transcript: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Process a voice command through the orchestrator, in the caller's chat session."""
+        info = info_enabled()
+        if info:
+            self._log_command.info("Processing voice command", transcript=transcript)
         
         # Process through Gemini with registered functions
-        result = await self.voice_handler.process_voice_command(transcript)
+        result = await self.voice_handler.process_voice_command(transcript, session_id)
         
         # Log the result
         if result.get("status") == "success":
-            logger.info("Voice command processed", 
-                       transcript=transcript,
-                       function_calls=result.get("function_calls"))
+            if info:
+                self._log_command.info("Voice command processed",
+                                       transcript=transcript,
+                                       function_calls=result.get("function_calls"))
         else:
-            logger.error("Voice command failed",
-                        transcript=transcript,
-                        error=result.get("error"))
+            self._log_command.error("Voice command failed",
+                                    transcript=transcript,
+                                    error=result.get("error"))
         
         return result
     
@@ -337,38 +539,39 @@ class VoiceOrchestrator:
         """Start an interactive voice session."""
         logger.info("Starting voice session")
         
-        print("\n🎤 Voice Orchestrator Active")
-        print("Say commands like:")
-        print("  - 'Execute task to process ETL pipeline'")
-        print("  - 'Check orchestrator status'")
-        print("  - 'Run ETL pipeline for customer data'")
-        print("  - 'Create an artifact with today's report'")
-        print("  - 'Start training the recommendation model'")
-        print("\nType 'exit' to quit\n")
+        sys.stdout.write(_HELP_BANNER)
+        sys.stdout.flush()
+        
+        # Show task progress while Gemini's reply is still pending
+        self.voice_handler.add_partial_listener(_print_partial)
         
-        while True:
-            try:
-                # In production, this would capture actual voice input
-                # For now, we use text input as a simulation
-                command = input("🎤 Voice command (or type): ")
+        try:
+            while True:
+                try:
+                    # In production, this would capture actual voice input
+                    # For now, we use text input as a simulation
+                    command = await _ainput(_PROMPT)
                 
-                if command.lower() in ['exit', 'quit', 'stop']:
-                    break
+                    if command.lower() in ['exit', 'quit', 'stop']:
+                        break
                 
-                # Process the command
-                result = await self.process_voice_command(command)
+                    # Process the command
+                    result = await self.process_voice_command(command, _INTERACTIVE_SESSION)
                 
-                # Display result
-                if result.get("response"):
-                    print(f"\n🤖 {result['response']}\n")
-                else:
-                    print(f"\n🤖 Command processed: {result.get('message', 'Success')}\n")
+                    # Display result
+                    if result.get("response"):
+                        print(f"\n🤖 {result['response']}\n")
+                    else:
+                        print(f"\n🤖 Command processed: {result.get('message', 'Success')}\n")
                 
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                logger.error("Voice session error", error=str(e))
-                print(f"\n❌ Error: {str(e)}\n")
-        
-        print("\n👋 Voice session ended")
+                except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
+                    # Ctrl+C arrives as a cancellation while awaiting input under asyncio.run
+                    break
+                except Exception as e:
+                    logger.exception("Voice session error")
+                    print(f"\n❌ Error: {e}\n")
+        finally:
+            # Always write queued telemetry, however the session ends
+            await self.flush_telemetry()
+            print("\n👋 Voice session ended")
         logger.info("Voice session ended")
\ No newline at end of file